@@ -13,13 +13,18 @@ from .ui import panel
 LOG_DIR = os.path.join(os.path.expanduser("~"), ".tsbot")
 LOG_PATH = os.path.join(LOG_DIR, "tsbot_errors.log")
 
+# Ctrl-C / Ctrl-D / explicit cancel: show "Cancelled" without logging
+_CANCEL_TYPES = (KeyboardInterrupt, EOFError, UserCancelled)
+
 def _log_error(e: BaseException) -> str:
     try:
         os.makedirs(LOG_DIR, exist_ok=True)
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        buf = f"\n[{ts}] {type(e).__name__}: {e}\n" + "".join(
+            traceback.format_exception(type(e), e, e.__traceback__)
+        )
         with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(f"\n[{ts}] {type(e).__name__}: {e}\n")
-            traceback.print_exc(file=f)
+            f.write(buf)
         return LOG_PATH
     except Exception:
         return ""
@@ -36,22 +41,19 @@ def catch_all(*, flow: str = "App", on_cancel: str = "stay"):
         def _wrapped(*args, **kwargs):
             try:
                 return fn(*args, **kwargs)
-            except (KeyboardInterrupt, EOFError):
-                panel("↩️ Cancelled.")
-                if on_cancel == "exit":
-                    # exit entire tool
-                    sys.exit(0)
-                # else: just return to caller (stay in current flow/menu)
-                return
-            except UserCancelled:
-                panel("↩️ Cancelled.")
-                if on_cancel == "exit":
-                    sys.exit(0)
-                return
             except SystemExit:
                 raise
-            except Exception as e:
-                path = _log_error(e)
+            except BaseException as e:
+                if isinstance(e, _CANCEL_TYPES):
+                    panel("↩️ Cancelled.")
+                    if on_cancel == "exit":
+                        # exit entire tool
+                        sys.exit(0)
+                    # else: just return to caller (stay in current flow/menu)
+                    return
+                if not isinstance(e, Exception):
+                    raise
+                _log_error(e)
                 panel(f"↩️ Back to Main Menu")
                 return
         return _wrapped
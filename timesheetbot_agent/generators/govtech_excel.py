@@ -7,62 +7,122 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Sequence
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill, Border
+from openpyxl.utils import get_column_letter
 
 PH_DEFAULT: Dict[str, str] = {}
 
+_WEEKEND = frozenset((5, 6))  # Sat, Sun
+
+# Merged value cells in the header and user-details blocks
+_HEADER_MERGES = (
+    "B2:D2",  # Description value
+    "B3:D3",  # PO Ref value
+    "B4:D4",  # PO Date value
+    "G2:H2",  # Month/Year value
+    "G3:H3",  # Contractor value
+    "B6:D6",  # Name
+    "B7:D7",  # Role
+    "B8:D8",  # Group
+    "G6:H6",  # Skill Level
+)
+# Signature rows (offset from the totals row) whose B:D values are merged:
+# officer rows +2..+4, reporting officer rows +6..+8
+_SIGNATURE_MERGE_ROWS = (2, 3, 4, 6, 7, 8)
+
 # Reuse your exact styles
 from ..styles import (
     thin_border, white_fill, yellow_fill, light_green_fill, lighter_green_fill,
     light_yellow_fill, light_blue_fill, light_red_fill, bold_font, red_font,
-    black_font, center_alignment, right_alignment
+    black_font, arial_font, arial_black_font, arial_red_font, center_alignment,
+    right_alignment, left_bottom_alignment, center_bottom_alignment, center_wrap_alignment,
 )
 
 # ---------- Helpers ----------
 
+# English month names as stored in leave_details ("11-August"); locale-independent
+_MONTHS: Dict[str, int] = {
+    name: i for i, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"),
+        start=1,
+    )
+}
+
+
+def _parse_dd_month(s, year: int) -> datetime:
+    """'11-August' -> datetime(year, 8, 11) without going through strptime."""
+    day_s, _, month_s = str(s).partition("-")
+    try:
+        return datetime(year, _MONTHS[month_s.strip().lower()], int(day_s))
+    except (KeyError, ValueError):
+        raise ValueError(f"Unrecognised leave date {s!r} (expected DD-Month)") from None
+
+
 def _expand_leaves(
     leave_details: List[Sequence],
     year: int
-) -> List[Tuple[str, str]]:
+) -> Tuple[List[Tuple[str, str]], bool]:
     """
     Accepts:
       - (start '%d-%B', end '%d-%B' or None, leave_type)
       - (date '%d-%B', leave_type)
     where the container can be a tuple **or** list.
-    Returns list of (YYYY-MM-DD, leave_type)
+    Returns (list of (YYYY-MM-DD, leave_type), whether any entry is NS Leave)
     """
     expanded: List[Tuple[str, str]] = []
+    ns_present = False
 
     for entry in leave_details:
-        if isinstance(entry, (list, tuple)) and len(entry) == 3:
+        # Ignore malformed entries silently
+        if not isinstance(entry, (list, tuple)):
+            continue
+        if len(entry) == 3:
             start_s, end_s, leave_type = entry
             if not end_s:
                 end_s = start_s
-
-            start_dt = datetime.strptime(str(start_s), "%d-%B").replace(year=year)
-            end_dt = datetime.strptime(str(end_s), "%d-%B").replace(year=year)
-
-            while start_dt <= end_dt:
-                expanded.append((start_dt.strftime("%Y-%m-%d"), str(leave_type)))
-                start_dt += timedelta(days=1)
-
-        elif isinstance(entry, (list, tuple)) and len(entry) == 2:
-            date_s, leave_type = entry
-            dt = datetime.strptime(str(date_s), "%d-%B").replace(year=year)
-            expanded.append((dt.strftime("%Y-%m-%d"), str(leave_type)))
-
-        # Ignore malformed entries silently
-
-    return expanded
-
-
-def _col_letter(idx: int) -> str:
-    """1-based column index -> Excel column letter."""
-    div, mod = divmod(idx - 1, 26)
-    letter = chr(65 + mod)
-    if div == 0:
-        return letter
-    return _col_letter(div) + letter
+        elif len(entry) == 2:
+            start_s, leave_type = entry
+            end_s = start_s
+        else:
+            continue
+
+        ns_present = ns_present or leave_type == "NS Leave"
+        start_dt = _parse_dd_month(start_s, year)
+        end_dt = _parse_dd_month(end_s, year)
+        leave_type = str(leave_type)
+
+        while start_dt <= end_dt:
+            expanded.append((f"{start_dt.year:04d}-{start_dt.month:02d}-{start_dt.day:02d}", leave_type))
+            start_dt += timedelta(days=1)
+
+    return expanded, ns_present
+
+
+def _styled(
+    ws,
+    value=None,
+    *,
+    font: Optional[Font] = None,
+    fill: Optional[PatternFill] = None,
+    border: Optional[Border] = None,
+    alignment: Optional[Alignment] = None,
+    number_format: Optional[str] = None,
+) -> WriteOnlyCell:
+    """Build a styled cell for ws.append() on a write-only sheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
 
 
 # ---------- Main generator ----------
@@ -93,18 +153,15 @@ def generate_govtech_timesheet(
     description = profile["description"]
     reporting_officer = profile["reporting_officer"]
     timesheet_preference = float(profile.get("timesheet_preference", 1.0))  # 8.5 or 1.0
+    hourly = timesheet_preference == 8.5  # hours-based sheet (vs. 1.0 = day-based)
 
     # Public holidays (fallback to packaged defaults)
     PH: Dict[str, str] = public_holidays if public_holidays is not None else PH_DEFAULT
     # Remarks map
     REMARKS: Dict[str, str] = remarks or {}
 
-    # Whether to show NS column
-    ns_leave_present = any(
-        (isinstance(x, (list, tuple)) and len(x) == 3 and x[2] == "NS Leave") or
-        (isinstance(x, (list, tuple)) and len(x) == 2 and x[1] == "NS Leave")
-        for x in leave_details
-    )
+    # Expand leaves to per-day entries; also tells us whether to show the NS column
+    expanded, ns_leave_present = _expand_leaves(leave_details, year)
 
     # File setup
     month_name = datetime(year, month, 1).strftime("%B")
@@ -124,58 +181,16 @@ def generate_govtech_timesheet(
     filename = f"{month_name}_{year}_Timesheet_{name.replace(' ', '_')}.xlsx"
     out_path = out_dir / filename
 
-    # Workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = f"{month_name} {year} Timesheet"
+    # Remarks follow the leave columns (after NS when present)
+    remarks_col = 9 if ns_leave_present else 8
 
-    # ---------- Header blocks ----------
-    ws.merge_cells("B2:D2")  # Description value
-    ws.merge_cells("B3:D3")  # PO Ref value
-    ws.merge_cells("B4:D4")  # PO Date value
-    ws.merge_cells("G2:H2")  # Month/Year value
-    ws.merge_cells("G3:H3")  # Contractor value
-
-    ws["A2"], ws["B2"] = "Description", description
-    ws["A3"], ws["B3"] = "PO Ref", po_ref
-    ws["A4"], ws["B4"] = "PO Date", po_date
-    ws["F2"], ws["G2"] = "Month/Year", f"{month_name} - {year}"
-    ws["F3"], ws["G3"] = "Contractor", contractor
-
-    # Borders for A-D rows 2..4
-    for r in range(2, 5):
-        for c in ("A", "B", "C", "D"):
-            ws[f"{c}{r}"].border = thin_border
-
-    # Borders for F-H rows 2..3
-    for r in (2, 3):
-        for c in ("F", "G", "H"):
-            ws[f"{c}{r}"].border = thin_border
-
-    # Yellow fill for values (B-D) and Month/Year (G2:H2)
-    for r in range(2, 5):
-        for c in ("B", "C", "D"):
-            ws[f"{c}{r}"].fill = yellow_fill
-    for c in ("G", "H"):
-        ws[f"{c}2"].fill = yellow_fill
-        ws[f"{c}3"].fill = PatternFill(fill_type=None)  # Contractor not yellow
-
-    # Ensure column E is blank (no fill, no border)
-    for r in range(2, 5):
-        ws[f"E{r}"].border = Border()
-        ws[f"E{r}"].fill = PatternFill(fill_type=None)
-
-    # Alignment for header values
-    for r in range(2, 5):
-        for c in ("B", "C", "D"):
-            ws[f"{c}{r}"].alignment = Alignment(horizontal="center", vertical="bottom")
-    for r in (2, 3):
-        for c in ("G", "H"):
-            ws[f"{c}{r}"].alignment = Alignment(horizontal="center", vertical="bottom")
-    for r in range(2, 5):
-        ws[f"A{r}"].alignment = Alignment(horizontal="left", vertical="bottom")
-
-    # Column widths (match legacy + ensure headers aren’t truncated)
+    # Workbook (write-only: rows are streamed to disk as they are appended,
+    # so everything below is emitted strictly top-to-bottom)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=f"{month_name} {year} Timesheet")
+
+    # Column widths (match legacy + ensure headers aren’t truncated).
+    # Write-only sheets need these before the first row is appended.
     ws.column_dimensions["A"].width = 20   # SN (wider)
     ws.column_dimensions["B"].width = 25   # Date / value blocks
     ws.column_dimensions["C"].width = 10   # At Work
@@ -184,42 +199,59 @@ def generate_govtech_timesheet(
     ws.column_dimensions["F"].width = 20   # Childcare Leave (wider per request)
     ws.column_dimensions["G"].width = 20   # Annual Leave
     ws.column_dimensions["H"].width = 16   # Remarks (base)
-    ws["B2"].alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    if ns_leave_present:
+        ws.column_dimensions["H"].width = 22  # NS column
+    # Keep remarks column comfortably wide
+    ws.column_dimensions[get_column_letter(remarks_col)].width = 22
 
-    # ---------- User details ----------
-    ws.merge_cells("B6:D6")  # Name
-    ws.merge_cells("B7:D7")  # Role
-    ws.merge_cells("B8:D8")  # Group
-    ws.merge_cells("G6:H6")  # Skill Level
-
-    ws["A6"], ws["B6"] = "Name", name
-    ws["A7"], ws["B7"] = "Role Specialization", role_specialization
-    ws["A8"], ws["B8"] = "Group/Specialization", group_specialization
-    ws["F6"], ws["G6"] = "Skill Level", skill_level
-
-    # Borders
-    for r in range(6, 9):
-        for c in ("A", "B", "C", "D"):
-            ws[f"{c}{r}"].border = thin_border
-    for c in ("F", "G", "H"):
-        ws[f"{c}6"].border = thin_border
-
-    # Yellow fills for values
-    for r in range(6, 9):
-        for c in ("B", "C", "D"):
-            ws[f"{c}{r}"].fill = yellow_fill
-    for c in ("G", "H"):
-        ws[f"{c}6"].fill = yellow_fill
-
-    # Keep E blank
-    for r in range(6, 9):
-        ws[f"E{r}"].border = Border()
-        ws[f"E{r}"].fill = PatternFill(fill_type=None)
+    # ---------- Header blocks ----------
+    for rng in _HEADER_MERGES:
+        ws.merged_cells.add(rng)
+
+    label_align = left_bottom_alignment
+    value_align = center_bottom_alignment
+
+    def _label(text):
+        return _styled(ws, text, font=arial_font, border=thin_border, alignment=label_align)
+
+    def _yellow(value=None, alignment=value_align):
+        return _styled(ws, value, font=arial_font, fill=yellow_fill, border=thin_border, alignment=alignment)
+
+    ws.append([])
+    # Column E stays blank (no fill, no border); Contractor value is not yellow
+    ws.append([
+        _label("Description"),
+        _yellow(description, center_wrap_alignment),
+        _yellow(), _yellow(), None,
+        _styled(ws, "Month/Year", font=arial_font, border=thin_border),
+        _yellow(f"{month_name} - {year}"), _yellow(),
+    ])
+    ws.append([
+        _label("PO Ref"), _yellow(po_ref), _yellow(), _yellow(), None,
+        _styled(ws, "Contractor", font=arial_font, border=thin_border),
+        _styled(ws, contractor, font=arial_font, border=thin_border, alignment=value_align),
+        _styled(ws, None, font=arial_font, border=thin_border, alignment=value_align),
+    ])
+    ws.append([_label("PO Date"), _yellow(po_date), _yellow(), _yellow()])
+    ws.append([])
 
+    # ---------- User details ----------
     # Left align merged B cells; center the Skill Level value
-    for r in range(6, 9):
-        ws[f"B{r}"].alignment = Alignment(horizontal="left", vertical="bottom")
-    ws["G6"].alignment = center_alignment
+    def _detail_row(label, value):
+        return [
+            _styled(ws, label, font=arial_font, border=thin_border),
+            _yellow(value, label_align),
+            _yellow(alignment=None), _yellow(alignment=None),
+        ]
+
+    ws.append(_detail_row("Name", name) + [
+        None,
+        _styled(ws, "Skill Level", font=arial_font, border=thin_border),
+        _yellow(skill_level, center_alignment), _yellow(alignment=None),
+    ])
+    ws.append(_detail_row("Role Specialization", role_specialization))
+    ws.append(_detail_row("Group/Specialization", group_specialization))
+    ws.append([])
 
     # ---------- Table headers ----------
     headers = ["SN", "Date", "At Work", "Public Holiday", "Sick Leave", "Childcare Leave", "Annual Leave"]
@@ -234,23 +266,15 @@ def generate_govtech_timesheet(
     fills.append(white_fill)
 
     # All headers non-bold to match your latest requirement
-    NON_BOLD = set(headers)
-    for col_idx, (hdr, fill) in enumerate(zip(headers, fills), start=1):
-        cell = ws.cell(row=10, column=col_idx, value=hdr)
-        cell.font = Font(name="Arial", size=12, bold=(hdr not in NON_BOLD), color="000000")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = thin_border
-        cell.fill = fill
-
-    ws["A10"].font = Font(name="Arial", size=12, bold=False, color="000000")
-    ws["A10"].alignment = Alignment(horizontal="center", vertical="center")
-
-    # NS width tweak
-    if ns_leave_present:
-        ws.column_dimensions["I"].width = 15  # NS column width
+    ws.append([
+        _styled(ws, hdr, font=arial_black_font, fill=fill, border=thin_border, alignment=center_alignment)
+        for hdr, fill in zip(headers, fills)
+    ])
 
     # ---------- Data rows ----------
-    expanded = _expand_leaves(leave_details, year)
+    leave_by_date: Dict[str, List[str]] = {}
+    for leave_date, ltype in expanded:
+        leave_by_date.setdefault(leave_date, []).append(ltype)
     _, days_in_month = monthrange(year, month)
 
     totals = {
@@ -265,33 +289,33 @@ def generate_govtech_timesheet(
 
     start_row = 11
     sn = 1
+    first_weekday = datetime(year, month, 1).weekday()  # Mon=0..Sun=6
 
-    # Column indices
-    at_work_col = 3
-    ph_col = 4
-    sick_col = 5
-    cc_col = 6
-    al_col = 7
-    ns_col = 8 if ns_leave_present else None
-    remarks_col = 9 if ns_leave_present else 8
+    def _day_cell(value, fill=None):
+        return _styled(ws, value, font=arial_font, fill=fill, border=thin_border, alignment=center_alignment)
+
+    def _leave_cell(value):
+        # Leave columns are yellow, right-aligned "0.0", blank when zero
+        return _styled(ws, "" if value == 0.0 else value, font=arial_font, fill=yellow_fill,
+                       border=thin_border, alignment=right_alignment, number_format="0.0")
 
-    # Paint Date column (B) yellow (legacy behavior)
-    for r in range(start_row, start_row + days_in_month):
-        ws[f"B{r}"].fill = yellow_fill
+    # Off-day efforts count as a full day's work
+    extra_day = 8.0 if hourly else 1.0
+
+    # Default At Work per weekday (Mon..Sun)
+    if hourly:
+        default_at_work = (8.5, 8.5, 8.5, 8.5, 8.0, 0.0, 0.0)  # Fri=8.0
+    else:
+        default_at_work = (timesheet_preference,) * 5 + (0.0, 0.0)
 
     for day in range(1, days_in_month + 1):
-        r = start_row + (day - 1)
-        date_obj = datetime(year, month, day)
-        ymd = date_obj.strftime("%Y-%m-%d")
-        disp_date = date_obj.strftime("%d-%B-%Y")
-        weekday = date_obj.weekday()  # Mon=0..Sun=6
-        key_dd_mon = date_obj.strftime("%d-%B")  # e.g., "11-August"
+        ymd = f"{year:04d}-{month:02d}-{day:02d}"
+        disp_date = f"{day:02d}-{month_name}-{year}"
+        weekday = (first_weekday + day - 1) % 7
+        key_dd_mon = f"{day:02d}-{month_name}"  # e.g., "11-August"
 
         # Defaults
-        if timesheet_preference == 8.5:
-            at_work = 8.5 if weekday in (0, 1, 2, 3) else 8.0  # Fri=8.0
-        else:
-            at_work = timesheet_preference if weekday not in (5, 6) else 0.0
+        at_work = default_at_work[weekday]
 
         ph = 0.0
         sick = 0.0
@@ -314,41 +338,39 @@ def generate_govtech_timesheet(
             ph = 1.0
             remark = PH[ymd]
 
-        # Apply leaves
-        for leave_date, ltype in expanded:
-            if leave_date != ymd:
-                continue
-
+        # Apply leaves (leave types only count on working days)
+        off_day = weekday in _WEEKEND or ymd in PH
+        for ltype in leave_by_date.get(ymd, ()):
             if ltype == "Sick Leave":
-                if weekday not in (5, 6) and ymd not in PH:
+                if not off_day:
                     sick = 1.0
                     at_work = 0.0
 
             elif ltype == "Childcare Leave":
-                if weekday not in (5, 6) and ymd not in PH:
+                if not off_day:
                     cc = 1.0
                     at_work = 0.0
 
             elif ltype == "Annual Leave":
-                if weekday not in (5, 6) and ymd not in PH:
+                if not off_day:
                     al = 1.0
                     at_work = 0.0
 
             elif ltype == "NS Leave":
-                if weekday not in (5, 6) and ymd not in PH:
+                if not off_day:
                     ns = 1.0
                     at_work = 0.0
 
             elif ltype == "Weekend Efforts":
-                if weekday in (5, 6) or ymd in PH:
-                    at_work = 8.0 if timesheet_preference == 8.5 else 1.0
+                if off_day:
+                    at_work = extra_day
 
             elif ltype == "Public Holiday Efforts":
                 if ymd in PH:
-                    at_work = 8.0 if timesheet_preference == 8.5 else 1.0
+                    at_work = extra_day
 
             elif ltype == "Half Day":
-                if timesheet_preference == 8.5:
+                if hourly:
                     at_work = 4.0 if weekday == 4 else 4.5
                 else:
                     at_work = 0.5
@@ -368,141 +390,77 @@ def generate_govtech_timesheet(
         if ns_leave_present:
             totals["National Service Leave"] += ns
 
-        # Row values (blank zeros, PH column uses "-" for 0.0 like legacy)
-        row_vals: List = [
-            sn,
-            disp_date,
-            "" if at_work == 0.0 else at_work,
-            "-" if ph == 0.0 else ph,
-            "" if sick == 0.0 else sick,
-            "" if cc == 0.0 else cc,
-            "" if al == 0.0 else al,
+        # Row cells (blank zeros, PH column uses "-" for 0.0 like legacy)
+        row_cells = [
+            _day_cell(sn),
+            _day_cell(disp_date, yellow_fill),  # Date column (B) yellow (legacy behavior)
+            _leave_cell(at_work),
+            _styled(ws, "-" if ph == 0.0 else ph, font=arial_font, border=thin_border,
+                    alignment=right_alignment, number_format="0.0"),  # PH not yellow
+            _leave_cell(sick),
+            _leave_cell(cc),
+            _leave_cell(al),
         ]
         if ns_leave_present:
-            row_vals.append("" if ns == 0.0 else ns)
-
-        row_vals.append(remark)
-
-        # Write row
-        for c_idx, val in enumerate(row_vals, start=1):
-            cell = ws.cell(row=r, column=c_idx, value=val)
-            cell.alignment = center_alignment
-            cell.border = thin_border
+            row_cells.append(_leave_cell(ns))
 
-        # Yellow fill for leave columns (not PH)
-        leave_cols = [at_work_col, sick_col, cc_col, al_col]
-        if ns_leave_present:
-            leave_cols.append(ns_col)
-
-        for c_idx in leave_cols:
-            ws.cell(row=r, column=c_idx).fill = yellow_fill
-
-        # Ensure PH column not yellow
-        ws.cell(row=r, column=ph_col).fill = PatternFill(fill_type=None)
-
-        # Right align numeric & PH columns
-        for c_idx in [at_work_col, ph_col, sick_col, cc_col, al_col] + ([ns_col] if ns_leave_present else []):
-            ws.cell(row=r, column=c_idx).alignment = right_alignment
-
-        # Remarks styling:
-        # rem_cell = ws.cell(row=r, column=remarks_col)
-        # rem_cell.alignment = right_alignment
-        # if rem_cell.value not in ["", "-"]:
-        #     # Weekend/PH -> red with light red background
-        #     if (ymd in PH) or (remark in ("Saturday", "Sunday")):
-        #         rem_cell.fill = light_red_fill
-        #         rem_cell.font = Font(name="Arial", size=12, color="FF0000", bold=False)
-        #     else:
-        #         # User comment or other – no red background, normal black text
-        #         rem_cell.font = Font(name="Arial", size=12, color="000000", bold=False)
-        # else:
-        #     rem_cell.font = black_font
-        rem_cell = ws.cell(row=r, column=remarks_col)
-        rem_cell.alignment = right_alignment
-
-        if rem_cell.value not in ["", "-"]:
-            rem_cell.fill = light_red_fill
-            rem_cell.font = Font(name="Arial", size=12, color="FF0000", bold=False)
+        # Remarks styling: weekend/PH/user comment -> red with light red background
+        if remark not in ["", "-"]:
+            rem_cell = _styled(ws, remark, font=arial_red_font,
+                               fill=light_red_fill, border=thin_border, alignment=right_alignment)
         else:
-            rem_cell.font = black_font
-
-        # Number format 0.0 for leave columns & PH
-        for c_idx in leave_cols + [ph_col]:
-            ws.cell(row=r, column=c_idx).number_format = "0.0"
+            rem_cell = _styled(ws, remark, font=black_font, border=thin_border, alignment=right_alignment)
+        row_cells.append(rem_cell)
 
+        ws.append(row_cells)
         sn += 1
 
+    ws.append([])
+    ws.append([])
+
     # ---------- Totals row ----------
     total_row = start_row + days_in_month + 2
-    ws[f"A{total_row}"].value = "Total"
-    ws[f"A{total_row}"].font = Font(name="Arial", size=12, bold=False, color="000000")
-    ws[f"A{total_row}"].alignment = center_alignment
-    ws[f"A{total_row}"].border = thin_border
-    ws[f"B{total_row}"].border = thin_border
 
     col_keys = ["At Work", "Public Holiday", "Sick Leave", "Childcare Leave", "Annual Leave"]
     if ns_leave_present:
         col_keys.append("National Service Leave")
 
-    for offset, key in enumerate(col_keys):
-        c_idx = 3 + offset
+    total_cells = [
+        _styled(ws, "Total", font=arial_font, border=thin_border, alignment=center_alignment),
+        _styled(ws, None, font=arial_font, border=thin_border),
+    ]
+    for key in col_keys:
         val = totals[key]
-        cell = ws.cell(row=total_row, column=c_idx, value=("-" if val == 0.0 else val))
-        cell.font = Font(name="Arial", size=12, bold=False, color="000000")
-        cell.alignment = right_alignment
-        cell.border = thin_border
-        cell.number_format = "0.0"
-
+        total_cells.append(_styled(ws, ("-" if val == 0.0 else val), font=arial_font, border=thin_border,
+                                   alignment=right_alignment, number_format="0.0"))
     # Border the final remarks column too
-    ws[f"{_col_letter(remarks_col)}{total_row}"].border = thin_border
+    total_cells.append(_styled(ws, None, font=arial_font, border=thin_border))
+    ws.append(total_cells)
+    ws.append([])
 
     # ---------- Signature block ----------
     current_date = datetime.now().strftime("%d - %b - %Y")
 
-    # Officer rows
-    ws.merge_cells(f"B{total_row + 2}:D{total_row + 2}")
-    ws.merge_cells(f"B{total_row + 3}:D{total_row + 3}")
-    ws.merge_cells(f"B{total_row + 4}:D{total_row + 4}")
-
-    # Reporting officer rows
-    ws.merge_cells(f"B{total_row + 6}:D{total_row + 6}")
-    ws.merge_cells(f"B{total_row + 7}:D{total_row + 7}")
-    ws.merge_cells(f"B{total_row + 8}:D{total_row + 8}")
-
-    ws[f"A{total_row + 2}"], ws[f"B{total_row + 2}"] = "Officer", name
-    ws[f"A{total_row + 3}"], ws[f"B{total_row + 3}"] = "Signature", name
-    ws[f"A{total_row + 4}"], ws[f"B{total_row + 4}"] = "Date", current_date
-
-    ws[f"A{total_row + 6}"], ws[f"B{total_row + 6}"] = "Reporting Officer", reporting_officer
-    ws[f"A{total_row + 7}"], ws[f"B{total_row + 7}"] = "Signature", ""
-    ws[f"A{total_row + 8}"], ws[f"B{total_row + 8}"] = "Date", ""
-
-    ws[f"B{total_row + 4}"].number_format = "DD - MMM - YYYY"
-    ws[f"B{total_row + 8}"].number_format = "DD - MMM - YYYY"
-
+    for offset in _SIGNATURE_MERGE_ROWS:
+        ws.merged_cells.add(f"B{total_row + offset}:D{total_row + offset}")
+
+    signature = [
+        ("Officer", name, None),
+        ("Signature", name, None),
+        ("Date", current_date, "DD - MMM - YYYY"),
+        (None, None, None),
+        ("Reporting Officer", reporting_officer, None),
+        ("Signature", "", None),
+        ("Date", "", "DD - MMM - YYYY"),
+    ]
     # Borders for A-D in signature area
-    for r in range(total_row + 2, total_row + 9):
-        for c in ("A", "B", "C", "D"):
-            ws[f"{c}{r}"].border = thin_border
-            ws[f"{c}{r}"].alignment = Alignment(horizontal="center", vertical="bottom")
-        ws[f"A{r}"].alignment = Alignment(horizontal="left", vertical="bottom")
-
-    # Global font: Arial 12 (don’t overwrite header row or remarks coloring)
-    arial = Font(name="Arial", size=12)
-    for r in range(1, ws.max_row + 1):
-        for c in range(1, ws.max_column + 1):
-            if r == 10:
-                continue
-            # keep Remarks row text coloring
-            if (c == remarks_col) and (start_row <= r < start_row + days_in_month):
-                continue
-            ws.cell(row=r, column=c).font = arial
-
-    # Keep remarks column comfortably wide
-    rem_letter = _col_letter(remarks_col)
-    ws.column_dimensions[rem_letter].width = 22
-    if ns_leave_present:
-        ws.column_dimensions["H"].width = 22  # NS column
+    for label, value, num_fmt in signature:
+        ws.append([
+            _styled(ws, label, font=arial_font, border=thin_border, alignment=label_align),
+            _styled(ws, value, font=arial_font, border=thin_border, alignment=value_align, number_format=num_fmt),
+            _styled(ws, None, font=arial_font, border=thin_border, alignment=value_align),
+            _styled(ws, None, font=arial_font, border=thin_border, alignment=value_align),
+        ])
 
     # Save
     wb.save(str(out_path))
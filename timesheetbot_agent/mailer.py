@@ -1,17 +1,70 @@
 # timesheetbot_agent/mailer.py
 from __future__ import annotations
 
+import functools
 import os
 import platform
+import re
+import string
 import subprocess
 import urllib.parse
-from pathlib import Path
-from typing import Optional
+
+
+# The platform cannot change within a process; resolve it once.
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+
+
+# Static AppleScript skeleton; only the escaped per-message fields are substituted.
+_OUTLOOK_SCRIPT_TEMPLATE = string.Template('''
+tell application "Microsoft Outlook"
+    activate
+    set newMsg to make new outgoing message with properties {subject:"$subject", content:""}
+    $recipients
+    -- Body is assigned once, after recipients, as a CRLF-joined expression
+    -- (keeps Outlook's line breaks without re-writing content per line)
+    set content of newMsg to $body
+    make new attachment at newMsg with properties {file:(POSIX file "$attachment")}
+    open newMsg
+    activate
+end tell
+''')
+
+
+# Backslash and double quote are the only characters AppleScript string literals need escaped.
+_APPLESCRIPT_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+_CRLF_JOINER = '" & (ASCII character 13) & (ASCII character 10) & "'
+# Everything str.splitlines() breaks on
+_LINE_BREAKS = re.compile(r"[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# local@domain with no whitespace, control chars, angle brackets, quotes or backslashes;
+# anything else would at best produce a broken AppleScript literal
+_ADDR_RE = re.compile(r'[^\s<>"\\\x00-\x1f]+@[^\s<>"\\\x00-\x1f]+')
+
+_RCPT_TMPL = 'make new {kind} at newMsg with properties {{email address:{{address:"{addr}"}}}}'
 
 
 def _esc(s: str) -> str:
     """Escape for AppleScript string literals."""
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return s.translate(_APPLESCRIPT_ESCAPE)
+
+
+def _addr_list(addrs) -> list:
+    """Materialize an address argument (None, a single string, or any iterable) once."""
+    if not addrs:
+        return []
+    if isinstance(addrs, str):
+        return [addrs]
+    return list(addrs)
+
+
+@functools.lru_cache(maxsize=512)
+def _rcpt_line(kind: str, addr: str) -> str:
+    """One 'make new <kind>' line; cached since the same recipients recur across mails."""
+    # addr has passed _ADDR_RE, which rejects '"' and '\\', so it needs no escaping
+    return _RCPT_TMPL.format(kind=kind, addr=addr)
 
 
 def _as_outlook_body_appleexpr(s: str) -> str:
@@ -19,83 +72,90 @@ def _as_outlook_body_appleexpr(s: str) -> str:
     Build an AppleScript expression that concatenates lines with CRLF:
     "Hi," & (ASCII character 13) & (ASCII character 10) & ...
     """
-    lines = s.splitlines()
-    if not lines:
-        return '""'
-    joiner = '" & (ASCII character 13) & (ASCII character 10) & "'
-    return '"' + joiner.join(_esc(line) for line in lines) + '"'
+    if not _LINE_BREAKS.search(s):
+        # Single line (subjects, one-line bodies): no split/join needed
+        return '"' + _esc(s) + '"'
+    return '"' + _CRLF_JOINER.join(_esc(line) for line in s.splitlines()) + '"'
 
 
-def send_via_graph(
-    *, tenant_id: str, client_id: str, from_upn: str,
-    to_email: str, subject: str, body_text: str,
-    attachment_path: Optional[Path] = None
-) -> None:
-    from .emailer import send_mail_via_graph  # thin wrapper
-    return send_mail_via_graph(
-        tenant_id=tenant_id,
-        client_id=client_id,
-        from_upn=from_upn,
-        to_email=to_email,
-        subject=subject,
-        body_text=body_text,
-        attachment_path=attachment_path,
-    )
+def __getattr__(name: str):
+    # send_via_graph is emailer.send_mail_via_graph itself (no pass-through frame).
+    # Imported on first access and cached, so Graph deps load only when used.
+    if name == "send_via_graph":
+        from .emailer import send_mail_via_graph
+        globals()["send_via_graph"] = send_mail_via_graph
+        return send_mail_via_graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def compose_outlook_mac(
     to, subject, body, attachment, cc=None, bcc=None,
 ) -> None:
-    if platform.system() != "Darwin":
+    proc = compose_outlook_mac_async(to, subject, body, attachment, cc, bcc)
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def compose_outlook_mac_async(
+    to, subject, body, attachment, cc=None, bcc=None,
+) -> subprocess.Popen:
+    """
+    Start the Outlook compose and return the running osascript process
+    without waiting for it, so callers can build the next script meanwhile.
+    Join with wait_all().
+    """
+    if not _IS_DARWIN:
         raise RuntimeError("Outlook AppleScript compose is only supported on macOS.")
 
-    lines = body.splitlines() or [""]
-    first = _esc(lines[0])
-    rest = [
-        f'set content of newMsg to (content of newMsg) & (ASCII character 10) & "{_esc(l)}"'
-        for l in lines[1:]
-    ]
-    append_lines_script = "\n".join(rest)
-
-    to_lines = "\n".join(
-        f'make new recipient at newMsg with properties {{email address:{{address:"{_esc(addr)}"}}}}'
-        for addr in (to or [])
-    )
-    cc = cc or []
-    bcc = bcc or []
-    cc_lines = "\n".join(
-        f'make new cc recipient at newMsg with properties {{email address:{{address:"{_esc(addr)}"}}}}'
-        for addr in cc
+    to, cc, bcc = _addr_list(to), _addr_list(cc), _addr_list(bcc)
+    if not (to or cc or bcc):
+        raise ValueError("no recipients")
+    for addr in (*to, *cc, *bcc):
+        if not _ADDR_RE.fullmatch(addr):
+            raise ValueError(f"invalid email address: {addr!r}")
+
+    body_expr = _as_outlook_body_appleexpr(body)
+
+    recipients = "\n".join(
+        _rcpt_line(kind, addr)
+        for kind, addrs in (("recipient", to), ("cc recipient", cc), ("bcc recipient", bcc))
+        for addr in addrs
     )
-    bcc_lines = "\n".join(
-        f'make new bcc recipient at newMsg with properties {{email address:{{address:"{_esc(addr)}"}}}}'
-        for addr in bcc
+    script = _OUTLOOK_SCRIPT_TEMPLATE.substitute(
+        subject=_esc(subject),
+        recipients=recipients,
+        body=body_expr,
+        attachment=_esc(str(attachment)),
     )
-
-    script = f'''
-    tell application "Microsoft Outlook"
-        activate
-        set newMsg to make new outgoing message with properties {{subject:"{_esc(subject)}", content:""}}
-        -- Write the body FIRST, one line at a time (prevents Outlook from flattening)
-        set content of newMsg to "{first}"
-        {append_lines_script}
-        -- Now add recipients and attachment
-        {to_lines}
-        {cc_lines}
-        {bcc_lines}
-        make new attachment at newMsg with properties {{file:(POSIX file "{_esc(str(attachment))}")}}
-        open newMsg
-        activate
-    end tell
-    '''
-    subprocess.run(["osascript", "-e", script], check=True)
+    # Feed the script on stdin: one read + compile, and no ARG_MAX limit for long bodies
+    proc = subprocess.Popen(["osascript", "-"], stdin=subprocess.PIPE)
+    try:
+        try:
+            proc.stdin.write(script.encode("utf-8"))
+        finally:
+            proc.stdin.close()
+    except BaseException:
+        # e.g. BrokenPipeError when osascript exits early: reap it, the caller never sees the handle
+        proc.kill()
+        proc.wait()
+        raise
+    return proc
+
+
+def wait_all(procs) -> None:
+    """Wait for compose_outlook_mac_async processes; raise for the first that failed."""
+    failed = None
+    for proc in procs:
+        if proc.wait() != 0 and failed is None:
+            failed = proc
+    if failed is not None:
+        raise subprocess.CalledProcessError(failed.returncode, failed.args)
 
 
 def compose_with_best_available(to, subject, body, attachment=None, cc=None):
     """Prefer native Outlook on macOS; otherwise fall back to mailto."""
-    system = platform.system()
     try:
-        if system == "Darwin":
+        if _IS_DARWIN:
             try:
                 compose_outlook_mac(to, subject, body, attachment, cc)
                 return
@@ -103,21 +163,25 @@ def compose_with_best_available(to, subject, body, attachment=None, cc=None):
                 # Fallback: open default mail client via mailto
                 pass
 
-        to_str = ";".join(to) if isinstance(to, (list, tuple)) else to
-        cc_str = ";".join(cc) if cc else ""
-        mailto = (
-            f"mailto:{urllib.parse.quote(to_str)}"
-            f"?subject={urllib.parse.quote(subject)}"
-            f"&body={urllib.parse.quote(body)}"
-        )
-        if cc_str:
-            mailto += f"&cc={urllib.parse.quote(cc_str)}"
-
-        if system == "Darwin":
+        mailto = _mailto_url(to, subject, body, cc)
+        if _IS_DARWIN:
             subprocess.run(["open", mailto], check=False)
-        elif system == "Windows":
+        elif _SYSTEM == "Windows":
             os.startfile(mailto)  # type: ignore[arg-type]
         else:
             subprocess.run(["xdg-open", mailto], check=False)
     except Exception as e:
         print(f"Could not launch mail client: {e}")
+
+
+def _mailto_url(to, subject, body, cc=None) -> str:
+    to_str = ";".join(to) if isinstance(to, (list, tuple)) else to
+    cc_str = ";".join(cc) if cc else ""
+    mailto = (
+        f"mailto:{urllib.parse.quote(to_str)}"
+        f"?subject={urllib.parse.quote(subject)}"
+        f"&body={urllib.parse.quote(body)}"
+    )
+    if cc_str:
+        mailto += f"&cc={urllib.parse.quote(cc_str)}"
+    return mailto
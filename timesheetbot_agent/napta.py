@@ -5,13 +5,21 @@ import json
 import os, sys
 import re
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple
+from urllib.parse import urlsplit
+from typing import Any, Dict, Optional, Tuple
+import asyncio
 import contextlib
 import atexit
+import calendar
+import functools
 import gc
-from weakref import WeakSet
+import queue
+import subprocess
+import textwrap
+import threading
+from weakref import WeakKeyDictionary, WeakSet
 
 # Optional dependency; used only as a fallback
 try:
@@ -19,6 +27,16 @@ try:
 except Exception:  # pragma: no cover
     browser_cookie3 = None  # type: ignore
 
+# Optional dependency; faster (de)serialisation of the view cache, stdlib json otherwise
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except Exception:  # pragma: no cover
+    _json_loads = json.loads
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 from playwright.sync_api import sync_playwright
 from playwright._impl._errors import TimeoutError as PlaywrightTimeoutError
 
@@ -54,6 +72,22 @@ NEXT_WEEK_BTN_XPATH = '/html/body/div[1]/div[2]/div[1]/div[2]/div[2]/div/button[
 CREATE_BTN_XPATH = '//button[contains(normalize-space(.), "Create")]'
 CREATE_TIMESHEET_XPATH = '//button[contains(normalize-space(.), "Create timesheet")]'
 
+# Accessible-name patterns for get_by_role("button", name=...)
+_RE_CREATE = re.compile(r"Create timesheet", re.I)
+_RE_SAVE = re.compile(r"^Save$", re.I)
+_RE_SUBMIT = re.compile(r"Submit for approval", re.I)
+_RE_CONFIRM = re.compile(r"^(Submit|Confirm|Yes|OK)$", re.I)
+_RE_NEXT = re.compile(r"Next|>", re.I)
+_RE_PREV = re.compile(r"Previous|<", re.I)
+
+# Anything that proves the SPA has mounted: period navigation, the grid, or any login screen
+# _on_login_page recognises (email form, Google button, "Welcome / Log in to continue").
+# Navigations only wait for the document to commit, then for this.
+TIMESHEET_READY_SELECTOR = (
+    f'{NEXT_WEEK_CY}, [data-cy*="navRight"], table, [role="grid"], '
+    'input[type="email"], button:has-text("Continue with Google"), :text("Log in to continue")'
+)
+
 # Store under ~/.tsbot/napta (tighter perms than ~/.cache)
 _APP_DIR = Path.home() / ".tsbot" / "napta"
 _APP_DIR.mkdir(parents=True, exist_ok=True)
@@ -70,17 +104,46 @@ _SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
 def _shot(name: str) -> str:
     return str(_SCREENSHOT_DIR / name)
 
-# Slim some network requests (helps speed)
-_ANALYTICS_HOSTS = (
-    "googletagmanager.com", "google-analytics.com", "segment.io", "sentry.io",
-    "plausible.io", "fullstory.com", "intercom.io", "hotjar.com",
+# Decoded STATE_PATH keyed on its mtime, so repeated sessions in one process skip the parse.
+_STATE_CACHE: Optional[Tuple[int, Dict[str, Any]]] = None
+
+def _storage_state() -> Optional[Dict[str, Any]]:
+    """Saved storage_state as a dict (None when there is no usable saved session)."""
+    global _STATE_CACHE
+    try:
+        mtime = STATE_PATH.stat().st_mtime_ns
+    except OSError:
+        _STATE_CACHE = None
+        return None
+    if _STATE_CACHE and _STATE_CACHE[0] == mtime:
+        return _STATE_CACHE[1]
+    try:
+        state = _json_loads(STATE_PATH.read_bytes())
+    except ValueError:
+        return None
+    _STATE_CACHE = (mtime, state)
+    return state
+
+# Slim some network requests (helps speed).
+# Matched against the request host and its parent domains (so "ingest.sentry.io" hits "sentry.io").
+_ANALYTICS_HOSTS = frozenset((
+    "googletagmanager.com", "google-analytics.com", "googleadservices.com", "doubleclick.net",
+    "segment.io", "segment.com", "sentry.io", "plausible.io", "fullstory.com",
+    "intercom.io", "intercomcdn.com", "hotjar.com", "hotjar.io",
+    "newrelic.com", "nr-data.net", "datadoghq.com", "datadoghq.eu", "browser-intake-datadoghq.com",
+    "amplitude.com", "mixpanel.com", "heapanalytics.com", "clarity.ms", "cdn.cookielaw.org",
     "gravatar.com", "unpkg.com",
-)
+))
 
 # Timeouts
 SHORT_TIMEOUT_MS = 4_000
 DEFAULT_TIMEOUT_MS = int(os.environ.get("NAPTA_TIMEOUT_MS", "30000"))  # 30s
 
+# Rendered view reuse: blindly (no browser) for a few seconds, and for longer
+# once the loaded page shows the same period fingerprint.
+_VIEW_CACHE_TTL_S = 10
+_VIEW_CACHE_FP_TTL_S = 60
+
 UA_DESKTOP = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/122.0 Safari/537.36"
@@ -95,15 +158,9 @@ def _now() -> str:
     """Backward-compatible timestamp helper (some code paths expect _now())."""
     return ts()
 
-class suppress_exc:
-    def __init__(self, raise_on_fail: bool = False):
-        self.raise_on_fail = raise_on_fail
-        self._exc = None
-    def __enter__(self):
-        return self
-    def __exit__(self, exc_type, exc, tb):
-        self._exc = exc
-        return not self.raise_on_fail
+# Best-effort blocks: `with _SILENCE: ...`. contextlib.suppress is stateless and
+# reentrant, so one shared instance serves every (nested) call site.
+_SILENCE = contextlib.suppress(Exception)
 
 @contextlib.contextmanager
 def _silence_stderr():
@@ -116,21 +173,55 @@ def _silence_stderr():
         yield
 
 
+def _is_tracker(url: str) -> bool:
+    host = (urlsplit(url).hostname or "").lower()
+    while host:
+        if host in _ANALYTICS_HOSTS:
+            return True
+        host = host.partition(".")[2]
+    return False
+
+# Not needed to read or drive the timesheet. Stylesheets stay: visibility checks depend on them.
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font"))
+_BLOCKED_SUFFIXES = (".map", ".svg", ".woff", ".woff2", ".ttf")
+
 def _route_slim(route):
     req = route.request
-    if req.resource_type in ("image", "media", "font"):
+    if req.resource_type in _BLOCKED_RESOURCE_TYPES:
         return route.abort()
     url = req.url
-    if url.endswith((".map", ".svg")):
-        return route.abort()
-    if any(h in url for h in _ANALYTICS_HOSTS):
+    if url.endswith(_BLOCKED_SUFFIXES) or _is_tracker(url):
         return route.abort()
     return route.continue_()
 
+# The same blocks as URL patterns for Chromium's Network.setBlockedURLs. Unlike a "**/*"
+# route, this needs no request interception, so the page keeps its HTTP cache.
+_BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "ico", "svg",
+    "mp4", "webm", "woff", "woff2", "ttf", "otf", "map",
+)
+
+@functools.lru_cache(maxsize=1)
+def _blocked_url_patterns() -> Tuple[str, ...]:
+    hosts = [p for h in sorted(_ANALYTICS_HOSTS) for p in (f"*://{h}/*", f"*://*.{h}/*")]
+    exts = [p for e in _BLOCKED_EXTENSIONS for p in (f"*.{e}", f"*.{e}?*")]
+    return tuple(hosts + exts)
+
+def _block_via_cdp(ctx, page) -> bool:
+    """Block trackers/assets for `page` through CDP; False when unavailable (caller routes instead)."""
+    with _SILENCE:
+        cdp = ctx.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send("Network.setBlockedURLs", {"urls": list(_blocked_url_patterns())})
+        return True
+    return False
+
 class NaptaAuthError(RuntimeError):
     pass
 
+@functools.lru_cache(maxsize=1)
 def _proxy_conf():
+    """Playwright proxy from the environment; read once, proxy settings are static per process."""
     url = os.getenv("PLAYWRIGHT_PROXY") or os.getenv("HTTPS_PROXY") or os.getenv("HTTP_PROXY")
     return {"server": url} if url else None
 
@@ -163,88 +254,147 @@ def _is_cancelled_exc(e: Exception) -> bool:
 
 # ────────────────────────────── Page read helpers ─────────────────────────────
 
+# In-page helpers shared by the status/wait scripts (spliced into each function body).
+_JS_PAGE_HELPERS = r"""
+  const STATUS_RE = /^(Not created|Draft|Open|Validated|Approval pending|Submitted)$/i;
+  const buttonNames = () => [...document.querySelectorAll("button, [role='button']")]
+    .filter((b) => b.getClientRects().length)
+    .map((b) => (b.getAttribute("aria-label") || b.innerText || "").trim());
+  const statusChip = () => {
+    for (const scope of ["header *", "main *"]) {
+      for (const el of document.querySelectorAll(scope)) {
+        if ((el.textContent || "").trim().length > 60) continue;
+        const t = (el.innerText || "").trim();
+        if (t && t.length <= 30 && STATUS_RE.test(t)) return t;
+      }
+    }
+    return "";
+  };
+  const isSubmitted = () => /^(approval pending|submitted)/i.test(statusChip());
+"""
+
+# First short element under header/main whose text is exactly a status (header is scanned first).
+_STATUS_CHIP_JS = "() => {" + _JS_PAGE_HELPERS + "  return statusChip();\n}"
+
 def _get_status_chip_text(page) -> str:
-    containers = [
-        "header",
-        "main >> div:near(:text('This week'), 800)",
-        "main >> div:has(button:has-text('Submit for approval'))",
-        "main >> div:has(button:has-text('Save'))",
-        "main",
-    ]
-    status_regex = r'^(Not created|Draft|Open|Validated|Approval pending|Submitted)$'
-    for scope in containers:
-        with suppress_exc():
-            loc = page.locator(f"{scope} >> text=/{status_regex}/i").first
-            if loc.count():
-                text = (loc.inner_text() or "").strip()
-                if text and len(text) <= 30:
-                    return text
+    with _SILENCE:
+        return page.evaluate(_STATUS_CHIP_JS) or ""
     return ""
 
-
+# Buttons + chip in one round-trip: {"chip": str, "create": bool, "save": bool, "submit": bool}.
+_PROBE_JS = "() => {" + _JS_PAGE_HELPERS + r"""
+  const names = buttonNames();
+  return {
+    chip: statusChip(),
+    create: names.some((t) => /Create timesheet/i.test(t)),
+    save: names.some((t) => /^Save$/i.test(t)),
+    submit: names.some((t) => /Submit for approval/i.test(t)),
+  };
+}"""
+
+def _probe(page) -> Dict[str, Any]:
+    with _SILENCE:
+        return page.evaluate(_PROBE_JS)
+    return {"chip": "", "create": False, "save": False, "submit": False}
+
+
+
+# Napta/Google sign-in screen: an email field, 'Continue with Google', or the Welcome / 'Log in to continue' page.
+_LOGIN_PAGE_JS = "() => {" + _JS_PAGE_HELPERS + r"""
+  if (document.querySelector('input[type="email"]')) return true;
+  if (buttonNames().some((t) => /continue with google/i.test(t))) return true;
+  const body = (document.body && document.body.innerText) || "";
+  return /welcome/i.test(body) && /log in to continue/i.test(body);
+}"""
+
+# Week-title / day-label patterns (compiled once; used on every navigation poll)
+_DATE_WORD = r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
+# Common date-range labels like "21–25 Oct 2025" or "21 Oct – 25 Oct"
+_RANGE_RE = re.compile(
+    rf"\b(\d{{1,2}}(?:\s*[–-]\s*\d{{1,2}})?\s*{_DATE_WORD}(?:\s*[–-]\s*\d{{1,2}}\s*{_DATE_WORD})?\s*(?:\d{{4}})?)\b",
+    re.I,
+)
+# Numeric styles, e.g. "W45 from 03-11-2025 to 09-11-2025" or "03-11-2025 – 09-11-2025"
+_NUMERIC_W_RE = re.compile(
+    r"\bW\d{1,2}\s+from\s+\d{2}-\d{2}-\d{4}\s+to\s+\d{2}-\d{2}-\d{4}\b",
+    re.I,
+)
+_NUMERIC_RANGE_RE = re.compile(
+    r"\b\d{1,2}-\d{1,2}-\d{4}\s*(?:–|-|to)\s*\d{1,2}-\d{1,2}-\d{4}\b",
+    re.I,
+)
+_WEEK_HEADING_RE = re.compile(r"week", re.I)
+_FROM_TO_RE = re.compile(r"\bfrom\s+(\d{2}-\d{2}-\d{4})\s+to\s+(\d{2}-\d{2}-\d{4})\b", re.I)
+_DMY_RANGE_RE = re.compile(r"\b(\d{2}-\d{2}-\d{4})\s*(?:–|-|to)\s*(\d{2}-\d{2}-\d{4})\b", re.I)
+_DAY_MONTH_RANGE_RE = re.compile(
+    r"\b(\d{1,2})\s*[–-]\s*(\d{1,2})\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(\d{4})\b",
+    re.I,
+)
+_PRETTY_DAY_RE = re.compile(
+    r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s*(\d{1,2})[-/](\d{1,2})[-/]\d{2,4}$',
+    re.I,
+)
+_HEADER_DAY_RE = re.compile(
+    r"(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\b(?:.*?\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}))?",
+    re.I,
+)
 
 def _get_week_title(page) -> str:
-    # Prefer common date-range labels like "21–25 Oct 2025" or "21 Oct – 25 Oct"
-    date_word = r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
-    range_re = re.compile(
-        rf"\b(\d{{1,2}}(?:\s*[–-]\s*\d{{1,2}})?\s*{date_word}(?:\s*[–-]\s*\d{{1,2}}\s*{date_word})?\s*(?:\d{{4}})?)\b",
-        re.I,
-    )
-    # Support numeric styles, e.g. "W45 from 03-11-2025 to 09-11-2025" or "03-11-2025 – 09-11-2025"
-    numeric_w_re = re.compile(
-        r"\bW\d{1,2}\s+from\s+\d{2}-\d{2}-\d{4}\s+to\s+\d{2}-\d{2}-\d{4}\b",
-        re.I,
-    )
-    numeric_range_re = re.compile(
-        r"\b\d{1,2}-\d{1,2}-\d{4}\s*(?:–|-|to)\s*\d{1,2}-\d{1,2}-\d{4}\b",
-        re.I,
-    )
-
     # A) Period label near navigation
-    with suppress_exc():
+    with _SILENCE:
         loc = page.locator('[data-cy*="Period"][data-cy*="Label"], [aria-live="polite"]').first
         if loc.count():
             txt = (loc.inner_text() or "").strip()
             # Try month-name range
-            m = range_re.search(txt)
+            m = _RANGE_RE.search(txt)
             if m:
                 return m.group(1)
             # Try numeric "W## from DD-MM-YYYY to DD-MM-YYYY"
-            m2 = numeric_w_re.search(txt)
+            m2 = _NUMERIC_W_RE.search(txt)
             if m2:
                 return m2.group(0)
             # Try generic numeric "DD-MM-YYYY – DD-MM-YYYY"
-            m3 = numeric_range_re.search(txt)
+            m3 = _NUMERIC_RANGE_RE.search(txt)
             if m3:
                 return m3.group(0)
 
     # B) Any visible element that looks like a date-range (month-name)
-    with suppress_exc():
+    with _SILENCE:
         loc = page.locator("text=/\\d{1,2}\\s*[–-]\\s*\\d{1,2}\\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)/i").first
         if loc.count():
             return (loc.inner_text() or "").strip()
 
     # B2) Any visible element that looks like a purely numeric range
-    with suppress_exc():
+    with _SILENCE:
         loc = page.locator("text=/\\b\\d{2}-\\d{2}-\\d{4}\\s*(?:–|-|to)\\s*\\d{2}-\\d{2}-\\d{4}\\b/i").first
         if loc.count():
             return (loc.inner_text() or "").strip()
 
     # C) Back-compat headings
-    with suppress_exc():
-        h = page.locator("h1,h2,h3").filter(has_text=re.compile(r"week", re.I)).first
+    with _SILENCE:
+        h = page.locator("h1,h2,h3").filter(has_text=_WEEK_HEADING_RE).first
         if h.count():
             t = (h.inner_text() or "").strip()
             if t:
                 return t
 
     # D) "Week 42"
-    with suppress_exc():
+    with _SILENCE:
         t = page.locator("text=/Week\\s+\\d+/i").first
         if t.count():
             return (t.inner_text() or "").strip()
     return ""
 
+_DAY_NAMES = tuple(calendar.day_name)  # Monday..Sunday, resolved once
+
+def _day_labels(start: datetime, days: int) -> list[str]:
+    """['Monday 03-11-2025', 'Tuesday 04-11-2025', ...] for `days` days from `start`."""
+    out = []
+    for i in range(days):
+        d = start + timedelta(days=i)
+        out.append(f"{_DAY_NAMES[d.weekday()]} {d.day:02d}-{d.month:02d}-{d.year}")
+    return out
+
 def _labels_from_title(title: str) -> list[str]:
     """
     Build clean weekday labels from a title like:
@@ -253,50 +403,80 @@ def _labels_from_title(title: str) -> list[str]:
       - '21–25 Oct 2025'  (we will expand based on the start date)
     Returns labels like: ['Monday 03-11-2025', 'Tuesday 04-11-2025', ...]
     """
-    import re
-    from datetime import datetime, timedelta
+    period = _title_period(title)
+    return _day_labels(*period) if period else []
 
+def _title_period(title: str) -> Optional[Tuple[datetime, int]]:
+    """(first day, day count clamped to 1..7) parsed from a week title, or None."""
     title = (title or "").strip()
 
     # Try numeric "from ... to ..."
-    m = re.search(r"\bfrom\s+(\d{2}-\d{2}-\d{4})\s+to\s+(\d{2}-\d{2}-\d{4})\b", title, flags=re.I)
+    m = _FROM_TO_RE.search(title)
     if not m:
         # Try generic numeric range "DD-MM-YYYY – DD-MM-YYYY" or "... - ..."
-        m = re.search(r"\b(\d{2}-\d{2}-\d{4})\s*(?:–|-|to)\s*(\d{2}-\d{2}-\d{4})\b", title, flags=re.I)
+        m = _DMY_RANGE_RE.search(title)
     if m:
         start = datetime.strptime(m.group(1), "%d-%m-%Y")
         end = datetime.strptime(m.group(2), "%d-%m-%Y")
         days = (end - start).days + 1
         days = max(1, min(days, 7))  # clamp to 1..7
-        out = []
-        for i in range(days):
-            d = start + timedelta(days=i)
-            out.append(f"{d.strftime('%A')} {d.strftime('%d-%m-%Y')}")
-        return out
+        return start, days
 
     # Try textual month like "21–25 Oct 2025" → expand 5 days
-    m = re.search(
-        r"\b(\d{1,2})\s*[–-]\s*(\d{1,2})\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(\d{4})\b",
-        title, flags=re.I
-    )
+    m = _DAY_MONTH_RANGE_RE.search(title)
     if m:
         d1, d2, mon, year = int(m.group(1)), int(m.group(2)), m.group(3), int(m.group(4))
         start = datetime.strptime(f"{d1:02d}-{mon}-{year}", "%d-%b-%Y")
         days = max(1, min((d2 - d1 + 1), 7))
-        out = []
-        for i in range(days):
-            d = start + timedelta(days=i)
-            out.append(f"{d.strftime('%A')} {d.strftime('%d-%m-%Y')}")
-        return out
+        return start, days
+
+    return None
 
-    return []
 
+# Weekday header texts (th / ARIA columnheaders), whitespace-normalized, de-duplicated, ' | '-joined.
+_PERIOD_FINGERPRINT_JS = r"""
+() => {
+  const DAY = /(monday|tuesday|wednesday|thursday|friday|saturday|sunday)/i;
+  const seen = new Set();
+  const out = [];
+  for (const el of document.querySelectorAll("th, [role='columnheader']")) {
+    const t = (el.textContent || "").split(/\s+/).filter(Boolean).join(" ");
+    if (t && DAY.test(t) && !seen.has(t)) { seen.add(t); out.push(t); }
+  }
+  return out.join(" | ");
+}
+"""
+
+# [period label, header fingerprint] as currently shown (either may be "").
+_PERIOD_PARTS_JS = "() => {\n  const fp = (" + _PERIOD_FINGERPRINT_JS + r""")();
+  const el = document.querySelector('[data-cy*="Period"][data-cy*="Label"]');
+  const label = el ? (el.innerText || "").split(/\s+/).filter(Boolean).join(" ") : "";
+  return [label, fp];
+}"""
+
+# JSON '[label, fp]' marker ("" when the page shows neither).
+_PERIOD_MARKER_JS = "() => {\n  const [label, fp] = (" + _PERIOD_PARTS_JS + r""")();
+  return (label || fp) ? JSON.stringify([label, fp]) : "";
+}"""
+
+# Truthy once the period moved past `prev` (the marker taken before clicking). With a label
+# before, only a new non-empty label counts (headers may unmount/skeleton while the old week
+# is still shown); without one, a new non-empty fingerprint.
+_PERIOD_CHANGED_JS = "(prev) => {\n  const [pl, pf] = JSON.parse(prev);\n  const [label, fp] = (" + _PERIOD_PARTS_JS + r""")();
+  return pl ? (!!label && label !== pl) : (!!fp && fp !== pf);
+}"""
 
 def _period_fingerprint(page) -> str:
     """
     Robust fallback for detecting a period change when we can't parse the title.
     Based on the visible weekday header labels (often include explicit dates).
+    One in-page pass over the header cells; the locator walk only runs for
+    DIV-only layouts that have no header cells at all.
     """
+    with _SILENCE:
+        fp = page.evaluate(_PERIOD_FINGERPRINT_JS)
+        if fp:
+            return fp
     try:
         tbl = _find_timesheet_table(page)
         if not tbl or not tbl.count():
@@ -312,27 +492,26 @@ def _period_fingerprint(page) -> str:
 
 
 def _saw_saved_toast(page) -> bool:
-    with suppress_exc():
+    with _SILENCE:
         page.wait_for_selector("text=/\\bSaved\\b/i", timeout=SHORT_TIMEOUT_MS)
         return True
     return False
 
-def _has_submit_button(page) -> bool:
-    with suppress_exc():
-        if page.get_by_role("button", name=re.compile(r"Submit for approval", re.I)).count():
-            return True
-    with suppress_exc():
+def _has_submit_button(page, probe: Optional[Dict[str, Any]] = None) -> bool:
+    if (probe or _probe(page))["submit"]:
+        return True
+    with _SILENCE:
         if page.locator("xpath=" + SAVE_BTN_XPATH.replace("button","button[contains(.,'Submit')]")).count():
             return True
     return False
 
 def _click_save(page) -> bool:
-    with suppress_exc():
-        btn = page.get_by_role("button", name=re.compile(r"^Save$", re.I)).first
+    with _SILENCE:
+        btn = page.get_by_role("button", name=_RE_SAVE).first
         if btn.count():
             btn.click(timeout=SHORT_TIMEOUT_MS)
             return True
-    with suppress_exc():
+    with _SILENCE:
         btn = page.locator("xpath=" + SAVE_BTN_XPATH).first
         if btn.count():
             btn.click(timeout=SHORT_TIMEOUT_MS)
@@ -340,8 +519,8 @@ def _click_save(page) -> bool:
     return False
 
 def _click_submit(page) -> bool:
-    with suppress_exc():
-        btn = page.get_by_role("button", name=re.compile(r"Submit for approval", re.I)).first
+    with _SILENCE:
+        btn = page.get_by_role("button", name=_RE_SUBMIT).first
         if btn.count():
             btn.click(timeout=SHORT_TIMEOUT_MS)
             _confirm_submit_modal(page)  # <-- new
@@ -349,35 +528,73 @@ def _click_submit(page) -> bool:
     return False
 
 def _click_create(page) -> bool:
-    with suppress_exc():
+    with _SILENCE:
         b = page.locator("xpath=" + CREATE_TIMESHEET_XPATH).first
         if b.count():
             b.click(timeout=SHORT_TIMEOUT_MS)
             return True
-    with suppress_exc():
+    with _SILENCE:
         b = page.locator("xpath=" + CREATE_BTN_XPATH).first
         if b.count():
             b.click(timeout=SHORT_TIMEOUT_MS)
             return True
     return False
 
-def _wait_for_save_submit_chip(page, timeout_ms: int) -> Optional[str]:
+# 'create' | 'save' | 'submit' once a button shows up, 'done' for a submitted chip, else keep waiting.
+_SAVE_SUBMIT_STATE_JS = "() => {" + _JS_PAGE_HELPERS + r"""
+  const names = buttonNames();
+  if (names.some((t) => /Create timesheet/i.test(t))) return "create";
+  if (names.some((t) => /^Save$/i.test(t))) return "save";
+  if (names.some((t) => /Submit for approval/i.test(t))) return "submit";
+  return isSubmitted() ? "done" : false;
+}"""
+
+# Truthy once 'Submit for approval' is gone or the chip reads 'Approval pending' / 'Submitted'.
+_SUBMITTED_JS = "() => {" + _JS_PAGE_HELPERS + r"""
+  return !buttonNames().some((t) => /Submit for approval/i.test(t)) || isSubmitted();
+}"""
+
+# Grid has data rows (native or ARIA), or the week is empty and offers 'Create timesheet'.
+_GRID_READY_JS = "() => {" + _JS_PAGE_HELPERS + r"""
+  return !!document.querySelector("tbody tr")
+    || document.querySelectorAll("[role='grid'] [role='row'], [role='table'] [role='row']").length >= 2
+    || buttonNames().some((t) => /Create timesheet/i.test(t));
+}"""
+
+# Signed in: the timesheet UI (a Create/Save/Submit button or any status chip) is showing.
+_LOGGED_IN_JS = "() => {" + _JS_PAGE_HELPERS + r"""
+  return buttonNames().some((t) => /Create timesheet|^Save$|Submit for approval/i.test(t)) || !!statusChip();
+}"""
+
+def _backoff(start: float = 0.05, factor: float = 1.5, cap: float = 0.5):
+    """Geometric poll delays for Python-side waits: 50 ms, 75 ms, … capped at 500 ms."""
+    t = start
+    while True:
+        yield t
+        t = min(cap, t * factor)
+
+def _wait_js(page, predicate: str, timeout_ms: int, arg=None):
+    """
+    Let the browser poll `predicate(arg)` (every 150 ms) and return its first truthy value,
+    or None on timeout. Re-arms if the execution context is replaced mid-wait.
+    """
     end = time.time() + (timeout_ms / 1000.0)
-    while time.time() < end:
-        with suppress_exc():
-            if page.get_by_role("button", name=re.compile(r"Create timesheet", re.I)).count():
-                return "create"
-        with suppress_exc():
-            if page.get_by_role("button", name=re.compile(r"^Save$", re.I)).count():
-                return "save"
-        with suppress_exc():
-            if page.get_by_role("button", name=re.compile(r"Submit for approval", re.I)).count():
-                return "submit"
-        chip = (_get_status_chip_text(page) or "").lower().strip()
-        if chip.startswith(("approval pending", "submitted")):
+    while True:
+        left = int((end - time.time()) * 1000)
+        if left <= 0:
             return None
-        time.sleep(0.15)
-    return None
+        try:
+            return page.wait_for_function(predicate, arg=arg, polling=150, timeout=left).json_value()
+        except PlaywrightTimeoutError:
+            return None
+        except Exception as e:
+            if _is_cancelled_exc(e):
+                raise
+            time.sleep(0.15)
+
+def _wait_for_save_submit_chip(page, timeout_ms: int) -> Optional[str]:
+    state = _wait_js(page, _SAVE_SUBMIT_STATE_JS, timeout_ms)
+    return None if state == "done" else state
 
 
 def _confirm_submit_modal(page) -> bool:
@@ -385,9 +602,9 @@ def _confirm_submit_modal(page) -> bool:
     If a confirmation modal appears after clicking 'Submit for approval',
     press the confirm/submit button. Returns True if nothing blocked us.
     """
-    with suppress_exc():
+    with _SILENCE:
         # Common modal confirm buttons
-        btn = page.get_by_role("button", name=re.compile(r"^(Submit|Confirm|Yes|OK)$", re.I)).first
+        btn = page.get_by_role("button", name=_RE_CONFIRM).first
         if btn.count():
             btn.click(timeout=SHORT_TIMEOUT_MS)
             return True
@@ -399,17 +616,7 @@ def _wait_until_submitted(page, timeout_ms: int) -> bool:
     Wait until the status chip becomes 'Approval pending' or 'Submitted'
     OR the 'Submit for approval' button disappears.
     """
-    end = time.time() + (timeout_ms / 1000.0)
-    while time.time() < end:
-        with suppress_exc():
-            # button disappears?
-            if not page.get_by_role("button", name=re.compile(r"Submit for approval", re.I)).count():
-                return True
-        chip = (_get_status_chip_text(page) or "").strip().lower()
-        if chip.startswith(("approval pending", "submitted")):
-            return True
-        time.sleep(0.2)
-    return False
+    return bool(_wait_js(page, _SUBMITTED_JS, timeout_ms))
 
 
 # ────────────────────────── Table / grid view helpers ─────────────────────────
@@ -424,10 +631,7 @@ def _pretty_labels(day_cols):
     for _, lbl in day_cols:
         s = " ".join((lbl or "").strip().split())
         # Accept both 'Monday10-11-2025' and 'Monday 10-11-2025'
-        m = re.match(
-            r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s*(\d{1,2})[-/](\d{1,2})[-/]\d{2,4}$',
-            s, flags=re.I
-        )
+        m = _PRETTY_DAY_RE.match(s)
         if m:
             day = abbr[m.group(1).lower()]
             dd  = f"{int(m.group(2)):02d}"
@@ -442,7 +646,30 @@ def _pretty_labels(day_cols):
     return out
 
 
+# Resolved timesheet container per page: page -> (url, Locator).
+# A hit is re-validated with a single count(); main-frame navigations and the
+# week navigation helpers drop the entry.
+_TABLE_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+def _invalidate_page_cache(page) -> None:
+    with _SILENCE:
+        _TABLE_CACHE.pop(page, None)
+
 def _find_timesheet_table(page):
+    url = getattr(page, "url", None)  # Locators (no .url) are never cached
+    if url is not None:
+        with _SILENCE:
+            cached_url, loc = _TABLE_CACHE[page]
+            if cached_url == url and loc.count():
+                return loc
+    loc = _resolve_timesheet_table(page)
+    if url is not None:
+        with _SILENCE:
+            if loc.count():
+                _TABLE_CACHE[page] = (url, loc)
+    return loc
+
+def _resolve_timesheet_table(page):
     ci = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
     weekdays = ("monday","tuesday","wednesday","thursday","friday")
     parts = " or ".join([f"contains({ci}, '{d}')" for d in weekdays])
@@ -464,7 +691,10 @@ def _find_timesheet_table(page):
     # D) Near headings
     return page.locator("xpath=(//h1[contains(., 'Timesheet')]/following::*[self::table or @role='grid'])[1]").first
 
-def _get_weekday_headers(tbl_or_page):
+# Text of every matched element in one round-trip (textContent, else innerText).
+_TEXTS_JS = "els => els.map((e) => (e.textContent || '').trim() || (e.innerText || '').trim())"
+
+def _get_weekday_headers(tbl_or_page, title: Optional[str] = None):
     """
     Return [(col_index, label)].
     Strategy:
@@ -472,6 +702,9 @@ def _get_weekday_headers(tbl_or_page):
       2) Try ARIA grid columnheaders.
       3) Try generic DIV-based header strip.
       4) If all else fails AND we can parse the title on the page, synthesize labels.
+    The container is resolved once; each DOM strategy reads all its texts with a
+    single evaluate_all, so a strategy with nothing to match costs one call.
+    Pass `title` when the caller already read the week title, to skip re-reading it in 4).
     """
     def _dedupe_keep_order(pairs):
         seen = set()
@@ -483,102 +716,135 @@ def _get_weekday_headers(tbl_or_page):
                 out.append((idx, key))
         return out
 
-    headers = []
+    # Resolve the timesheet container once (strategies 1 and 3 share it)
+    tbl = tbl_or_page
+    found = None
+    with _SILENCE:
+        maybe_tbl = _find_timesheet_table(tbl_or_page)
+        if maybe_tbl and maybe_tbl.count():
+            tbl = found = maybe_tbl
 
     # 1) Native table header
-    try:
-        tbl = tbl_or_page
-        if hasattr(tbl_or_page, "locator"):
-            # If page, try to find the table first
-            maybe_tbl = _find_timesheet_table(tbl_or_page)
-            if maybe_tbl and maybe_tbl.count():
-                tbl = maybe_tbl
-        ths = tbl.locator("thead th")
-        if ths.count():
-            day_re = re.compile(
-                r"(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\b(?:.*?\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}))?",
-                re.I,
-            )
-            for i in range(ths.count()):
-                txt = ""
-                with suppress_exc():
-                    txt = (ths.nth(i).evaluate("el => el.textContent") or "").strip()
-                if not txt:
-                    with suppress_exc():
-                        txt = (ths.nth(i).inner_text() or "").strip()
-                txt = " ".join(txt.split())
-                m = day_re.search(txt)
-                if m:
-                    day = m.group(1).title()
-                    date = m.group(2)
-                    headers.append((i, f"{day} {date}" if date else day))
-            headers = _dedupe_keep_order(headers)
-            if headers:
-                return headers
-    except Exception:
-        pass
+    with _SILENCE:
+        headers = []
+        for i, txt in enumerate(tbl.locator("thead th").evaluate_all(_TEXTS_JS)):
+            m = _HEADER_DAY_RE.search(" ".join(txt.split()))
+            if m:
+                day = m.group(1).title()
+                date = m.group(2)
+                headers.append((i, f"{day} {date}" if date else day))
+        headers = _dedupe_keep_order(headers)
+        if headers:
+            return headers
 
     # 2) ARIA grid header
-    try:
-        tbl = tbl_or_page if not headers else tbl
-        if hasattr(tbl, "locator"):
-            cols = tbl.locator('[role="columnheader"]')
-            if cols.count():
-                day_names = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"]
-                for i in range(cols.count()):
-                    txt = ""
-                    with suppress_exc():
-                        txt = (cols.nth(i).evaluate("el => el.textContent") or "").strip()
-                    if not txt:
-                        with suppress_exc():
-                            txt = (cols.nth(i).inner_text() or "").strip()
-                    low = (txt or "").lower()
-                    for dn in day_names:
-                        if dn.lower() in low:
-                            headers.append((i, " ".join((txt or dn).split())))
-                            break
-                headers = _dedupe_keep_order(headers)
-                if headers:
-                    return headers
-    except Exception:
-        pass
+    with _SILENCE:
+        headers = []
+        day_names = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"]
+        for i, txt in enumerate(tbl_or_page.locator('[role="columnheader"]').evaluate_all(_TEXTS_JS)):
+            low = txt.lower()
+            for dn in day_names:
+                if dn.lower() in low:
+                    headers.append((i, " ".join((txt or dn).split())))
+                    break
+        headers = _dedupe_keep_order(headers)
+        if headers:
+            return headers
 
     # 3) Generic DIV-based header strip (very loose)
-    try:
-        tbl = _find_timesheet_table(tbl_or_page)
-        if tbl and tbl.count():
+    if found is not None:
+        with _SILENCE:
+            headers = []
             day_names = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"]
             ci = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
             day_xpath = " or ".join([f"contains({ci}, '{dn.lower()}')" for dn in day_names])
-            generic = tbl.locator(f"xpath=.//*[self::div or self::span or self::p][{day_xpath}]")
-            if generic.count():
-                for i in range(generic.count()):
-                    txt = ""
-                    with suppress_exc():
-                        txt = (generic.nth(i).evaluate('el => el.textContent') or '').strip()
-                    if not txt:
-                        with suppress_exc():
-                            txt = (generic.nth(i).inner_text() or '').strip()
-                    txt = " ".join((txt or "").split())
-                    if txt:
-                        headers.append((i, txt))
-                headers = _dedupe_keep_order(headers)[:7]
-                if headers:
-                    return headers
-    except Exception:
-        pass
+            generic = found.locator(f"xpath=.//*[self::div or self::span or self::p][{day_xpath}]")
+            for i, txt in enumerate(generic.evaluate_all(_TEXTS_JS)):
+                txt = " ".join(txt.split())
+                if txt:
+                    headers.append((i, txt))
+            headers = _dedupe_keep_order(headers)[:7]
+            if headers:
+                return headers
 
     # 4) Synthesize from title on page (assume project column is 0, days are 1..N)
-    try:
-        title = _get_week_title(tbl_or_page)
+    with _SILENCE:
+        if title is None:
+            title = _get_week_title(tbl_or_page)
         labels = _labels_from_title(title)
         if labels:
             return list(enumerate(labels, start=1))
-    except Exception:
-        pass
 
     return []
 
+# tbody rows → [[project, [raw day values], raw total | null]], or null when there is no tbody.
+# Values sit in cells 3,5,7,… (0-based 2,4,6,…); the weekly total, when rendered, in cell 14.
+# Per cell: the <input type=number> value, else the first number in the visible text.
+_NATIVE_ROWS_JS = r"""
+(root, dayCount) => {
+  const trs = root.querySelectorAll("tbody tr");
+  if (!trs.length) return null;
+  const norm = (s) => (s || "").split(/\s+/).filter(Boolean).join(" ");
+  const txt = (el) => norm(el.textContent) || norm(el.innerText);
+  const firstNum = (s) => { const m = (s || "").match(/\d+(?:\.\d+)?/); return m ? m[0] : null; };
+  const num = (cell) => {
+    const inp = cell.querySelector("input[type='number']");
+    const v = inp ? (inp.getAttribute("value") || "").trim() : "";
+    if (v && !isNaN(Number(v))) return v;
+    const el = cell.querySelector(
+      "p:not([aria-hidden='true']), span:not([aria-hidden='true']), div:not([aria-hidden='true'])");
+    return (el && firstNum(el.innerText)) || firstNum(cell.innerText) || "";
+  };
+  const out = [];
+  for (const tr of trs) {
+    const tds = tr.querySelectorAll("td");
+    if (tds.length < 3) continue;
+    let proj = txt(tds[0]);
+    if (!proj) {
+      const p0 = tds[0].querySelector("p, div, span");
+      if (p0) proj = txt(p0);
+    }
+    if (!proj) continue;
+    const vals = [];
+    for (let i = 2; i < tds.length && vals.length < dayCount; i += 2) vals.push(num(tds[i]));
+    out.push([proj, vals, tds.length >= 14 ? num(tds[13]) : null]);
+  }
+  return out;
+}
+"""
+
+# ARIA rows (rowgroup rows, else any row) → [[first cell text, [texts of the remaining cells]]].
+_ARIA_ROWS_JS = r"""
+(root) => {
+  const norm = (s) => (s || "").split(/\s+/).filter(Boolean).join(" ");
+  const txt = (el) => norm(el.textContent) || norm(el.innerText);
+  let rows = root.querySelectorAll('[role="rowgroup"] [role="row"]');
+  if (!rows.length) rows = root.querySelectorAll('[role="row"]');  // broad fallback
+  const out = [];
+  for (const r of rows) {
+    const cells = [...r.querySelectorAll('[role="gridcell"], [role="cell"]')];
+    if (!cells.length) continue;
+    const proj = txt(cells[0]);
+    if (!proj) continue;
+    out.push([proj, cells.slice(1).map(txt)]);
+  }
+  return out;
+}
+"""
+
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
+def _sum_days(values) -> str:
+    """Total of the first number in each cell: ['1d', '0.5d', ''] → '1.5d'."""
+    return f"{sum(float(m.group()) for v in values if v and (m := _NUM_RE.search(v))):g}d"
+
+def _fmt_days(v: str) -> str:
+    """'0.50' → '0.5d'; empty/unparseable → '0d'."""
+    try:
+        return f"{float(v):g}d"
+    except (TypeError, ValueError):
+        return "0d"
+
 def _verbatim_grid(tbl, day_cols):
     """Read rows for native tables and ARIA grids, aligned to weekday count, ignoring frozen dup & totals."""
     rows = []
@@ -586,15 +852,6 @@ def _verbatim_grid(tbl, day_cols):
     # number of weekday columns we want to render (Mon..Fri or Mon..Sun)
     day_count = max(0, len(day_cols))
 
-    def _txt(loc):
-        s = ""
-        with suppress_exc():
-            s = (loc.evaluate("el => el.textContent") or "").strip()
-        if not s:
-            with suppress_exc():
-                s = (loc.inner_text() or "").strip()
-        return " ".join((s or "").split())
-
     # Helper: post-process the values scraped after the project column
     def _sanitize_values(values, proj):
         # 1) Some layouts repeat the frozen "project" column again as the first value
@@ -620,70 +877,20 @@ def _verbatim_grid(tbl, day_cols):
         return values
 
     # ───────── Native <table> (alternate control/value cells) ─────────
-    body_rows = tbl.locator("tbody tr")
-    if body_rows.count():
-        import re
-
-        def _read_cell_number(cell):
-            # Prefer the hidden <input type=number> value
-            with suppress_exc():
-                inp = cell.locator("input[type='number']").first
-                if inp.count():
-                    v = (inp.get_attribute("value") or "").strip()
-                    if v:
-                        return f"{float(v):g}d"
-            # Fallback: visible text (ignore aria-hidden)
-            with suppress_exc():
-                el = cell.locator(
-                    "p:not([aria-hidden='true']),"
-                    "span:not([aria-hidden='true']),"
-                    "div:not([aria-hidden='true'])"
-                ).first
-                if el.count():
-                    t = (el.inner_text() or "").strip()
-                    m = re.search(r"\d+(?:\.\d+)?", t)
-                    if m:
-                        return f"{float(m.group(0)):g}d"
-            # Last resort: raw text
-            with suppress_exc():
-                raw = (cell.inner_text() or "").strip()
-                m = re.search(r"\d+(?:\.\d+)?", raw)
-                if m:
-                    return f"{float(m.group(0)):g}d"
-            return "0d"
-
-        for rix in range(body_rows.count()):
-            r = body_rows.nth(rix)
-            tds = r.locator("td")
-            if tds.count() < 3:
-                continue
+    # One round-trip: the browser walks tbody and returns raw numbers; formatting stays here.
+    native = tbl.evaluate(_NATIVE_ROWS_JS, len(day_cols) or 5)
+    if native is not None:
+        day_count = len(day_cols) or 5  # Mon..Fri when headers were not found
 
-            # Project = td #1
-            proj = _txt(tds.nth(0))
-            if not proj:
-                with suppress_exc():
-                    p0 = tds.nth(0).locator("p, div, span").first
-                    if p0.count():
-                        proj = _txt(p0)
-            if not proj:
-                continue
-
-            # Values: accept 3,5,7,9,11  (0-based: 2,4,6,8,10)
-            day_count = max(0, len(day_cols)) or 5
-            value_idxs = [i for i in range(2, tds.count(), 2)][:day_count]
-            values = [_read_cell_number(tds.nth(i)) for i in value_idxs]
+        for proj, raw_values, raw_total in native:
+            values = [_fmt_days(v) for v in raw_values]
 
             # Total (if present): td #14  (0-based index 13)
-            total = ""
-            if tds.count() >= 14:
-                total = _read_cell_number(tds.nth(13))
+            if raw_total is not None:
+                total = _fmt_days(raw_total)
             else:
                 # compute a total if Napta didn't render one
-                s = 0.0
-                for v in values:
-                    m = re.search(r'\d+(?:\.\d+)?', v or '')
-                    if m: s += float(m.group(0))
-                total = f"{s:g}d"
+                total = _sum_days(values)
 
             values = _sanitize_values(values, proj)
             rows.append((proj, values, total))
@@ -692,78 +899,105 @@ def _verbatim_grid(tbl, day_cols):
 
 
     # ───────── ARIA grid ─────────
-    aria_rows = tbl.locator('[role="rowgroup"] [role="row"]')
-    if not aria_rows.count():
-        aria_rows = tbl.locator('[role="row"]')  # broad fallback
-
-    for rix in range(aria_rows.count()):
-        r = aria_rows.nth(rix)
-        cells = r.locator('[role="gridcell"], [role="cell"]')
-        if not cells.count():
-            continue
-
-        # Project: first cell
-        proj = _txt(cells.nth(0))
-        if not proj:
-            continue
-
-        # Day cells: everything after the first cell, in order
-        values = [_txt(cells.nth(i)) for i in range(1, cells.count())]
+    for proj, values in tbl.evaluate(_ARIA_ROWS_JS):
         values = _sanitize_values(values, proj)
         rows.append((proj, values))
 
     return rows
 
 
+# Row-ish containers (class contains row/Row/timesheet/TableRow, else direct children), first 100;
+# per row: [first child text, [text of child j+1 for each header index j]].
+_FLEX_ROWS_JS = r"""
+(root, idxs) => {
+  const norm = (s) => (s || "").split(/\s+/).filter(Boolean).join(" ");
+  const txt = (el) => norm(el.textContent) || norm(el.innerText);
+  let rows = [...root.querySelectorAll(
+    "[class*='row'], [class*='Row'], [class*='timesheet'], [class*='TableRow']")];
+  if (!rows.length) rows = [...root.children];
+  const out = [];
+  for (const r of rows.slice(0, 100)) {
+    const cells = r.children;
+    if (cells.length < 2) continue;
+    const proj = txt(cells[0]);
+    if (!proj) continue;
+    out.push([proj, idxs.map((j) => (j + 1 < cells.length ? txt(cells[j + 1]) : ""))]);
+  }
+  return out;
+}
+"""
+
 def _read_flex_grid(tbl, day_cols):
     """
     Fallback reader for DIV-based layouts (no <table>, no ARIA roles).
     Heuristic: treat each immediate child (or obvious row container) as a row,
     first child as "Project", subsequent children as day cells.
+    The whole scan runs in the page (one round-trip).
     """
-    rows = []
+    data = tbl.evaluate(_FLEX_ROWS_JS, [j for j, _ in day_cols])
+    return [(proj, out) for proj, out in data]
 
-    # likely row containers
-    candidates = tbl.locator(
-        "xpath=.//*[contains(@class,'row') or contains(@class,'Row') or contains(@class,'timesheet') or contains(@class,'TableRow')]"
-    )
-    if not candidates.count():
-        # fallback: direct children
-        candidates = tbl.locator(":scope > *")
-
-    for i in range(min(100, candidates.count())):
-        r = candidates.nth(i)
-        # collect direct children as columns
-        cells = r.locator(":scope > *")
-        if cells.count() < 2:
-            continue
-        # project name
-        proj = ""
-        with suppress_exc():
-            proj = (cells.nth(0).evaluate("el => el.textContent") or "").strip()
-        if not proj:
-            with suppress_exc():
-                proj = (cells.nth(0).inner_text() or "").strip()
-        proj = " ".join((proj or "").split())
-        if not proj:
-            continue
-
-        # day cells – map by index count from headers
-        out = []
-        for j, _ in day_cols:
-            if j+1 >= cells.count():
-                out.append("")
-                continue
-            txt = ""
-            with suppress_exc():
-                txt = (cells.nth(j+1).evaluate("el => el.textContent") or "").strip()
-            if not txt:
-                with suppress_exc():
-                    txt = (cells.nth(j+1).inner_text() or "").strip()
-            out.append(" ".join((txt or "").split()))
-        rows.append((proj, out))
 
-    return rows
+@functools.lru_cache(maxsize=1)
+def _login_helper_script() -> str:
+    """Standalone login script for the subprocess fallback (built once per process)."""
+    return textwrap.dedent(f"""
+            import time
+            from playwright.sync_api import sync_playwright
+            DEFAULT_APP_URL = {DEFAULT_APP_URL!r}
+            STATE_PATH = {str(STATE_PATH)!r}
+            DEFAULT_TIMEOUT_MS = {DEFAULT_TIMEOUT_MS}
+            def _route_slim(route):
+                req = route.request
+                if req.resource_type in ("image","media","font"): return route.abort()
+                url = req.url
+                if url.endswith((".map",".svg")): return route.abort()
+                return route.continue_()
+            LOGGED_IN_JS = {_LOGGED_IN_JS!r}
+            def _logged_in(page):
+                try: return bool(page.evaluate(LOGGED_IN_JS))
+                except Exception: return False
+            with sync_playwright() as p:
+                br = p.chromium.launch(headless=False, args=["--disable-dev-shm-usage"])
+                ctx = br.new_context()
+                ctx.set_default_timeout(DEFAULT_TIMEOUT_MS)
+                ctx.route("**/*", _route_slim)
+                pg = ctx.new_page()
+                try:
+                    try:
+                        pg.goto(DEFAULT_APP_URL, timeout=45_000)
+                    except Exception:
+                        pg.goto("https://app.napta.io", timeout=45_000)
+                        pg.goto(DEFAULT_APP_URL, timeout=45_000)
+                    start = time.time()
+                    ok = False
+                    while time.time() - start < 180:
+                        if _logged_in(pg):
+                            ok = True; break
+                        time.sleep(0.5)
+                    if ok:
+                        ctx.storage_state(path=STATE_PATH)
+                    print("OK" if ok else "TIMEOUT")
+                finally:
+                    try: ctx.close()
+                    except Exception: pass
+                    try: br.close()
+                    except Exception: pass
+    """)
+
+
+# (next_week, submit, outcome) -> message for NaptaClient._do_action
+_ACTION_MESSAGES: Dict[Tuple[bool, bool, str], str] = {
+    (False, False, "submitted"): "ℹ️ Timesheet already submitted for this week.",
+    (False, False, "saved"):     "✅ Timesheet already saved. 'Submit for approval' is visible.",
+    (False, False, "done"):      "✅ Saved (draft).",
+    (True,  False, "saved"):     "✅ Next week already saved. 'Submit for approval' is visible.",
+    (True,  False, "done"):      "✅ Next week saved (draft).",
+    (False, True,  "submitted"): "ℹ️ Timesheet already submitted.",
+    (False, True,  "done"):      "✅ Submitted for approval.",
+    (True,  True,  "submitted"): "ℹ️ Next week already submitted.",
+    (True,  True,  "done"):      "✅ Next week submitted for approval.",
+}
 
 
 # ────────────────────────────── Napta Client (API) ───────────────────────────
@@ -779,6 +1013,7 @@ class NaptaClient:
         self._ctx = None
         self._page = None
         self._view_cache_path = _APP_DIR / "view_cache.json"
+        self._overlay_dismissed = False  # first-load banner/dialog, once per client
         self._closed = False
         _LIVE_CLIENTS.add(self)
 
@@ -810,9 +1045,7 @@ class NaptaClient:
         return self._submit_next_week_fast()
 
     def save_and_submit_current_week(self) -> Tuple[bool, str]:
-        ok, msg = self._save_current_week_fast()
-        if not ok:
-            return ok, msg
+        # One pass over the page: the submit flow already creates/saves first when needed.
         return self._submit_current_week_fast()
 
     def __del__(self) -> None:
@@ -837,14 +1070,18 @@ class NaptaClient:
                 args=["--disable-dev-shm-usage"],
             )
             # Use storage_state when available (avoid re-login)
-            if STATE_PATH.exists():
-                self._ctx = self._browser.new_context(storage_state=str(STATE_PATH))
+            state = _storage_state()
+            if state is not None:
+                self._ctx = self._browser.new_context(storage_state=state)
             else:
                 self._ctx = self._browser.new_context()
 
             self._ctx.set_default_timeout(DEFAULT_TIMEOUT_MS)
-            self._ctx.route("**/*", _route_slim)
-            self._page = self._ctx.new_page()
+            self._page = page = self._ctx.new_page()
+            if not _block_via_cdp(self._ctx, page):
+                self._ctx.route("**/*", _route_slim)
+            # Any main-frame navigation (including SPA history changes) drops the cached table locator
+            page.on("framenavigated", lambda frame: _invalidate_page_cache(page) if frame is page.main_frame else None)
 
             try:
                 self._page.add_init_script(f"Object.defineProperty(navigator, 'userAgent', {{get: () => '{UA_DESKTOP}'}});")
@@ -877,34 +1114,34 @@ class NaptaClient:
         with _silence_stderr():
 
             # Close leaf objects first.
-            with suppress_exc():
+            with _SILENCE:
                 if self._page:
-                    with suppress_exc():
+                    with _SILENCE:
                         self._page.close()
-            with suppress_exc():
+            with _SILENCE:
                 if self._ctx:
                     self._ctx.close()
-            with suppress_exc():
+            with _SILENCE:
                 if self._browser:
                     self._browser.close()
 
             # Critical: collect while Playwright's internal loop/transport is still up.
-            with suppress_exc():
+            with _SILENCE:
                 gc.collect()
 
             # Now stop Playwright (closes the driver connection + its internal loop).
-            with suppress_exc():
+            with _SILENCE:
                 if self._p:
                     self._p.stop()
 
             # One more GC after stop to clean up any leftover wrappers.
-            with suppress_exc():
+            with _SILENCE:
                 time.sleep(0.15)
-            with suppress_exc():
+            with _SILENCE:
                 gc.collect()
 
             self._p = self._browser = self._ctx = self._page = None
-            with suppress_exc():
+            with _SILENCE:
                 _LIVE_CLIENTS.discard(self)
 
     def close(self):
@@ -914,67 +1151,105 @@ class NaptaClient:
     # ────────────────── Auth helpers ──────────────────
 
     def _open_timesheet(self):
+        # Page already on the timesheet (earlier action of this client, e.g. save → submit):
+        # no reload if it shows (or snaps back to) the current week. Anything unverified — click
+        # failed, title unparsable — falls through to a full load below.
+        if (self._page.url or "").startswith(DEFAULT_APP_URL):
+            if self._on_current_week():
+                return
+            with _SILENCE: self._page.get_by_role("button", name="This week").click(timeout=400)
+            _invalidate_page_cache(self._page)
+            if self._on_current_week():
+                return
+
         last_err = None
-        for attempt in range(2):
+        # Retry at once, back off only if that fails too; fail fast on early attempts, full budget on the last
+        delays = (0, 0.3, 1.0)
+        for attempt, delay in enumerate(delays):
+            if delay:
+                time.sleep(delay)
             try:
-                self._page.goto(DEFAULT_APP_URL, timeout=45_000)
-                with suppress_exc(): self._page.wait_for_load_state("domcontentloaded", timeout=3_000)
-                with suppress_exc(): self._page.keyboard.press("Escape")
-                with suppress_exc(): self._page.get_by_role("button", name="This week").click(timeout=1_200)
-                with suppress_exc(): self._page.locator(f"xpath={THIS_WEEK_BTN_XPATH}").first.click(timeout=1_200)
+                _invalidate_page_cache(self._page)
+                nav_timeout = 45_000 if attempt == len(delays) - 1 else 15_000
+                self._page.goto(DEFAULT_APP_URL, wait_until="commit", timeout=nav_timeout)
+                with _SILENCE: self._page.wait_for_selector(TIMESHEET_READY_SELECTOR, state="attached", timeout=DEFAULT_TIMEOUT_MS)
+                if not self._overlay_dismissed:
+                    # First-load banner/dialog: only press Escape when one is actually open
+                    with _SILENCE:
+                        if self._page.locator('[role="dialog"], [role="alertdialog"]').count():
+                            self._page.keyboard.press("Escape")
+                    self._overlay_dismissed = True
+                # Napta normally opens on the current week; only click "This week" when it didn't,
+                # and the XPath variant only when the role-based click failed
+                if not self._on_current_week():
+                    clicked = False
+                    with _SILENCE:
+                        self._page.get_by_role("button", name="This week").click(timeout=1_200)
+                        clicked = True
+                    if not clicked:
+                        with _SILENCE: self._page.locator(f"xpath={THIS_WEEK_BTN_XPATH}").first.click(timeout=1_200)
                 return
             except Exception as e:
+                if _is_cancelled_exc(e):  # browser closed: retrying cannot help
+                    raise
                 last_err = e
-                time.sleep(0.6)
         raise last_err if last_err else RuntimeError("Failed to open timesheet")
 
+    def _on_current_week(self) -> bool:
+        """
+        True when the displayed week is this ISO week (False if the title can't be parsed).
+        Compares the week of the title's start date, not its visible days: a Mon–Fri title
+        ("21–25 Oct 2025") is still the current week on Saturday and Sunday.
+        """
+        with _SILENCE:
+            period = _title_period(_get_week_title(self._page))
+            if period:
+                start, _ = period
+                return start.isocalendar()[:2] == datetime.now().isocalendar()[:2]
+        return False
+
     # ─────────────────────────────── Login ───────────────────────────────
 
     def _on_login_page(self) -> bool:
-        with suppress_exc():
+        # One evaluate; the locator checks below only run if it fails (e.g. mid-navigation)
+        try:
+            return bool(self._page.evaluate(_LOGIN_PAGE_JS))
+        except Exception:
+            pass
+        with _SILENCE:
             if self._page.locator('input[type="email"]').count(): return True
-        with suppress_exc():
+        with _SILENCE:
             if self._page.get_by_role("button", name="Continue with Google").count(): return True
-        with suppress_exc():
+        with _SILENCE:
             if self._page.locator("text=Welcome").count() and self._page.locator("text=Log in to continue").count(): return True
         return False
 
     def _login_sync(self) -> Tuple[bool, str]:
         """
         Headed login to capture storage_state. If an asyncio loop is running
-        (e.g. when prompt_toolkit owns the TTY), run the same logic in a
-        subprocess to avoid the 'Playwright Sync API inside asyncio loop' error.
+        (e.g. when prompt_toolkit owns the TTY), run the same logic on a worker
+        thread (it has no loop, so the sync API is allowed there). A subprocess
+        helper remains as a last resort if Playwright refuses to start on it.
         """
-        import sys, subprocess, asyncio, textwrap, re, time
-
-        # Helper: do we already have a valid session open?
-        def _captured(ctx, page) -> bool:
-            with suppress_exc():
-                if page.get_by_role("button", name=re.compile(r"Create timesheet", re.I)).count():
-                    ctx.storage_state(path=str(STATE_PATH)); return True
-            with suppress_exc():
-                if page.get_by_role("button", name=re.compile(r"^Save$", re.I)).count():
-                    ctx.storage_state(path=str(STATE_PATH)); return True
-            with suppress_exc():
-                if page.get_by_role("button", name=re.compile(r"Submit for approval", re.I)).count():
-                    ctx.storage_state(path=str(STATE_PATH)); return True
-            chip = (_get_status_chip_text(page) or "").strip()
-            if chip:
-                with suppress_exc():
-                    ctx.storage_state(path=str(STATE_PATH))
-                return True
+        # Helper: do we already have a valid session open? (no side effects; state is written once by the caller)
+        def _captured(page) -> bool:
+            with _SILENCE:
+                return bool(page.evaluate(_LOGGED_IN_JS))
             return False
 
-        # Path 1: normal (no running event loop) — keep your original logic
         try:
             asyncio.get_running_loop()
             loop_running = True
         except RuntimeError:
             loop_running = False
 
-        if not loop_running:
-            from playwright.sync_api import sync_playwright as _sp  # original import path
-            with _sp() as p:
+        # Path 1: normal (no running event loop) — keep your original logic.
+        # `cancel` (worker path only) is checked between steps so an abandoned login closes its window.
+        def _headed(cancel: Optional[threading.Event] = None) -> Tuple[bool, str]:
+            def _cancelled() -> bool:
+                return cancel is not None and cancel.is_set()
+
+            with sync_playwright() as p:
                 browser = p.chromium.launch(
                     headless=False,
                     proxy=_proxy_conf(),
@@ -988,79 +1263,81 @@ class NaptaClient:
                     try:
                         page.goto(DEFAULT_APP_URL, timeout=45_000)
                     except Exception:
-                        with suppress_exc():
-                            page.goto("https://app.napta.io", timeout=45_000)
-                            page.goto(DEFAULT_APP_URL, timeout=45_000)
-
-                    # Wait for user to complete SSO (up to 3 minutes)
-                    start = time.time()
-                    while time.time() - start < 180:
-                        if _captured(ctx, page):
-                            self._cookie_ok = True
-                            return True, "✅ Login captured. You can now run: view / save / submit."
-                        time.sleep(0.5)
+                        with _SILENCE:
+                            if not _cancelled():
+                                page.goto("https://app.napta.io", timeout=45_000)
+                            if not _cancelled():
+                                page.goto(DEFAULT_APP_URL, timeout=45_000)
+
+                    # Wait for user to complete SSO (up to 3 minutes); the browser watches for the timesheet UI.
+                    # On the worker path the wait runs in 1 s slices so a cancel is noticed promptly.
+                    deadline = time.time() + 180
+                    slice_ms = 180_000 if cancel is None else 1_000
+                    signed_in = None
+                    try:
+                        while not signed_in:
+                            left_ms = int((deadline - time.time()) * 1000)
+                            if _cancelled():
+                                return False, "↩️ Cancelled."
+                            if left_ms <= 0:
+                                break
+                            signed_in = _wait_js(page, _LOGGED_IN_JS, min(slice_ms, left_ms))
+                    except Exception as e:
+                        if _is_cancelled_exc(e):  # login window closed by the user
+                            return False, "↩️ Cancelled."
+                        raise
+                    if signed_in and _captured(page):
+                        with _SILENCE:
+                            ctx.storage_state(path=str(STATE_PATH))
+                        self._cookie_ok = True
+                        return True, "✅ Login captured. You can now run: view / save / submit."
 
                     # timed out
                     name = f"napta_login_timeout_{ts()}.png"
-                    with suppress_exc():
-                        page.screenshot(path=_shot(name), full_page=True)
+                    with _SILENCE:
+                        page.screenshot(path=_shot(name))
                     return False, f"Login window timed out. Screenshot -> {name}"
                 finally:
-                    with suppress_exc():
+                    with _SILENCE:
                         ctx.close()
-                    with suppress_exc():
+                    with _SILENCE:
                         browser.close()
 
-        # Path 2: fallback when an asyncio loop is running — spawn a subprocess
-        helper = textwrap.dedent(f"""
-            import re, time
-            from playwright.sync_api import sync_playwright
-            DEFAULT_APP_URL = {DEFAULT_APP_URL!r}
-            STATE_PATH = {str(STATE_PATH)!r}
-            DEFAULT_TIMEOUT_MS = {DEFAULT_TIMEOUT_MS}
-            def _route_slim(route):
-                req = route.request
-                if req.resource_type in ("image","media","font"): return route.abort()
-                url = req.url
-                if url.endswith((".map",".svg")): return route.abort()
-                return route.continue_()
-            def _get_chip(page):
-                try:
-                    el = page.locator("header, main").locator("text=/^(Not created|Draft|Open|Approval pending|Submitted)$/i").first
-                    if el.count(): return (el.inner_text() or "").strip()
-                except Exception: pass
-                return ""
-            with sync_playwright() as p:
-                br = p.chromium.launch(headless=False, args=["--disable-dev-shm-usage"])
-                ctx = br.new_context()
-                ctx.set_default_timeout(DEFAULT_TIMEOUT_MS)
-                ctx.route("**/*", _route_slim)
-                pg = ctx.new_page()
-                try:
-                    try:
-                        pg.goto(DEFAULT_APP_URL, timeout=45_000)
-                    except Exception:
-                        pg.goto("https://app.napta.io", timeout=45_000)
-                        pg.goto(DEFAULT_APP_URL, timeout=45_000)
-                    start = time.time()
-                    ok = False
-                    while time.time() - start < 180:
-                        if pg.get_by_role("button", name=re.compile(r"Create timesheet", re.I)).count():
-                            ctx.storage_state(path=STATE_PATH); ok=True; break
-                        if pg.get_by_role("button", name=re.compile(r"^Save$", re.I)).count():
-                            ctx.storage_state(path=STATE_PATH); ok=True; break
-                        if pg.get_by_role("button", name=re.compile(r"Submit for approval", re.I)).count():
-                            ctx.storage_state(path=STATE_PATH); ok=True; break
-                        if _get_chip(pg):
-                            ctx.storage_state(path=STATE_PATH); ok=True; break
-                        time.sleep(0.5)
-                    print("OK" if ok else "TIMEOUT")
-                finally:
-                    try: ctx.close()
-                    except Exception: pass
-                    try: br.close()
-                    except Exception: pass
-        """)
+        if not loop_running:
+            return _headed()
+
+        # Path 2: an asyncio loop owns this thread — run the same login on a worker thread.
+        # No join timeout: _headed bounds itself (gotos + the 180 s SSO wait). Playwright objects
+        # belong to the worker, so Ctrl-C only signals it; the worker closes its own window.
+        result: queue.Queue = queue.Queue(maxsize=1)
+        cancel = threading.Event()
+
+        def _worker() -> None:
+            try:
+                result.put(_headed(cancel))
+            except BaseException as e:
+                result.put(e)
+
+        worker = threading.Thread(target=_worker, name="napta-login", daemon=True)
+        worker.start()
+        try:
+            while worker.is_alive():
+                worker.join(0.5)  # short joins keep Ctrl-C deliverable on every platform
+        except KeyboardInterrupt:
+            cancel.set()
+            worker.join(timeout=50)  # at most one in-flight goto before the worker sees the flag
+            return False, "↩️ Cancelled."
+        try:
+            outcome = result.get_nowait()
+        except queue.Empty:
+            return False, "Login window timed out or failed. Please try again."
+        if not isinstance(outcome, BaseException):
+            return outcome
+        if "greenlet" not in repr(outcome).lower():
+            raise outcome
+
+        # Path 3: Playwright could not drive from the worker thread — spawn a subprocess
+        helper = _login_helper_script()
         proc = subprocess.run([sys.executable, "-c", helper], capture_output=True, text=True)
         if proc.returncode == 0 and "OK" in proc.stdout and STATE_PATH.exists():
             self._cookie_ok = True
@@ -1070,17 +1347,29 @@ class NaptaClient:
 
     # ─────────────────────────────── View ───────────────────────────────
 
-    def _view_cache_get(self, which: str) -> Optional[str]:
+    def _view_cache_get(self, which: str, fingerprint: Optional[str] = None, chip: str = "") -> Optional[str]:
+        """Blind hit within _VIEW_CACHE_TTL_S; with a fingerprint, a hit needs the same period and status."""
         try:
-            d = json.loads(self._view_cache_path.read_text())
-            fresh = (time.time() - d["ts"]) < 10 and d.get("which")==which
+            d = _json_loads(self._view_cache_path.read_bytes())
+            if d.get("which") != which:
+                return None
+            age = time.time() - d["ts"]
+            if fingerprint is None:
+                fresh = age < _VIEW_CACHE_TTL_S
+            else:
+                fresh = (
+                    bool(fingerprint) and d.get("fp") == fingerprint and d.get("chip") == chip
+                    and age < _VIEW_CACHE_FP_TTL_S
+                )
             return d["text"] if fresh else None
         except Exception:
             return None
 
-    def _view_cache_put(self, which: str, text: str) -> None:
-        with suppress_exc():
-            self._view_cache_path.write_text(json.dumps({"ts": time.time(), "which": which, "text": text}))
+    def _view_cache_put(self, which: str, text: str, fingerprint: str = "", chip: str = "") -> None:
+        with _SILENCE:
+            self._view_cache_path.write_bytes(_json_dumps(
+                {"ts": time.time(), "which": which, "fp": fingerprint, "chip": chip, "text": text}
+            ))
 
     def _view_week_fast(self, which: str = "current") -> Tuple[bool, str]:
         """Render the current or next week view in readable grid format."""
@@ -1103,7 +1392,7 @@ class NaptaClient:
 
         if self._on_login_page():
             name = f"napta_login_required_{_now()}.png"
-            self._page.screenshot(path=_shot(name), full_page=True)
+            self._page.screenshot(path=_shot(name))
 
             # IMPORTANT: don’t keep a half-initialised Playwright session alive.
             # In PyInstaller builds this often causes “Task was destroyed…” / “event loop closed” noise.
@@ -1116,46 +1405,55 @@ class NaptaClient:
         if which == "next":
             if not self._go_to_next_week():
                 name = f"napta_nav_verify_{ts()}.png"
-                self._page.screenshot(path=_shot(name), full_page=True)
+                self._page.screenshot(path=_shot(name))
                 return False, f"❌ Navigation didn't land on next week. Screenshot -> {name}"
         elif which == "previous":
             if not self._go_to_previous_week():
                 name = f"napta_nav_verify_prev_{ts()}.png"
-                self._page.screenshot(path=_shot(name), full_page=True)
+                self._page.screenshot(path=_shot(name))
                 return False, f"❌ Navigation didn't land on previous week. Screenshot -> {name}"
             
-        # Allow DOM to fully update after week switch
+        # Allow DOM to fully update after week switch: wait for grid rows (or an empty week's Create button)
         self._page.wait_for_load_state("domcontentloaded", timeout=5_000)
-        time.sleep(1.5)
+        _wait_js(self._page, _GRID_READY_JS, 5_000)
 
         # Wait for Save/Submit buttons or state chips
         _ = _wait_for_save_submit_chip(self._page, timeout_ms=DEFAULT_TIMEOUT_MS)
         chip = _get_status_chip_text(self._page) or "unknown"
         title = _get_week_title(self._page) or "Week"
 
+        # Same period and status as the last render → skip the grid scrape
+        fp = _period_fingerprint(self._page)
+        cached = self._view_cache_get(which, fp, chip)
+        if cached:
+            return True, cached
+
         # Find the table/grid container
         tbl = _find_timesheet_table(self._page)
         if not tbl.count():
-            with suppress_exc():
-                self._page.goto(DEFAULT_APP_URL, timeout=45_000)
-                self._page.wait_for_load_state("domcontentloaded", timeout=3_000)
+            _invalidate_page_cache(self._page)
+            with _SILENCE:
+                self._page.goto(DEFAULT_APP_URL, wait_until="commit", timeout=45_000)
+                self._page.wait_for_selector(TIMESHEET_READY_SELECTOR, state="attached", timeout=DEFAULT_TIMEOUT_MS)
             tbl = _find_timesheet_table(self._page)
         if not tbl.count():
             msg = f"🗓 {title}\nStatus: {chip}\nℹ️ Could not locate the timesheet table."
-            self._view_cache_put(which, msg)
+            self._view_cache_put(which, msg, fp, chip)
             return True, msg
 
-        # Prefer robust headers (includes synthesized labels if DOM parsing fails)
-        day_cols = _get_weekday_headers(self._page) or _get_weekday_headers(tbl)
+        # Prefer robust headers (includes synthesized labels if DOM parsing fails).
+        # One pass over the page: it resolves the same (cached) table as `tbl`, so a second
+        # pass scoped to `tbl` could only repeat the same strategies on a subset.
+        day_cols = _get_weekday_headers(self._page, title=title)
         if not day_cols:
             msg = f"🗓 {title}\nStatus: {chip}\n(Headers not found)"
-            self._view_cache_put(which, msg)
+            self._view_cache_put(which, msg, fp, chip)
             return True, msg
 
         # Read rows
         rows = _verbatim_grid(tbl, day_cols)
         if not rows:
-            with suppress_exc():
+            with _SILENCE:
                 rows = _read_flex_grid(tbl, day_cols)
 
         # ─────────── Build formatted output ───────────
@@ -1185,14 +1483,16 @@ class NaptaClient:
                 return name.ljust(proj_width)
             return (name[:proj_width - 3] + " ..")
 
+        # One format string per view: project | day cells… |<gap>Total (gap on DATA ROWS only)
+        wc = len(day_headers)
+        row_fmt = (
+            "{} | " + " | ".join([f"{{:<{day_width}}}"] * wc)
+            + " |" + " " * gap_width + f"{{:<{total_width}}}"
+        )
+
         def fmt_row(project, cells, total):
-            wc = len(day_headers)
             cells = (cells + [""] * (wc - len(cells)))[:wc]
-            pj = _fit_project(project)
-            cs = " | ".join(c.ljust(day_width) for c in cells)
-            tt = (total or "").ljust(total_width)
-            # add gap AFTER the bar before Total (rows only)
-            return f"{pj} | {cs} |{' ' * gap_width}{tt}"
+            return row_fmt.format(_fit_project(project), *cells, total or "")
 
         # Header (NO extra gap here)
         hdr_parts = [_fit_project("Project")] + [h.ljust(day_width) for h in day_headers] + [total_header.ljust(total_width)]
@@ -1201,55 +1501,43 @@ class NaptaClient:
         lines.append("-" * max(40, len(hdr)))
 
         # Rows (auto-compute total when not provided)
-        import re
         if rows:
             for row in rows:
                 if len(row) == 3:
                     proj, cells, total = row
                 else:
                     proj, cells = row
-                    s = 0.0
-                    for v in cells:
-                        m = re.search(r'\d+(?:\.\d+)?', v or '')
-                        if m:
-                            s += float(m.group(0))
-                    total = f"{s:g}d"
+                    total = _sum_days(cells)
                 lines.append(fmt_row(proj, cells, total))
         else:
             lines.append("(No rows)")
 
         msg = "\n".join(lines)
-        self._view_cache_put(which, msg)
+        self._view_cache_put(which, msg, fp, chip)
         return True, msg
 
 
     def _go_to_next_week(self) -> bool:
         # Use either the parsed title or the header fingerprint as the "before" marker
-        before_title = (_get_week_title(self._page) or "").strip()
-        before_fp = _period_fingerprint(self._page)
-        before = before_title or before_fp
+        before = self._period_marker()
 
+        _invalidate_page_cache(self._page)
         attempts = 0
         while attempts < 3:
             attempts += 1
-            with suppress_exc():
+            with _SILENCE:
                 # data-cy variants
                 self._page.locator('[data-cy*="navRight"], [data-cy*="PeriodNavigation_navRight"]').first.click(timeout=SHORT_TIMEOUT_MS)
-            with suppress_exc():
+            with _SILENCE:
                 # generic "Next"
-                self._page.get_by_role("button", name=re.compile(r"Next|>", re.I)).first.click(timeout=SHORT_TIMEOUT_MS)
-            with suppress_exc():
+                self._page.get_by_role("button", name=_RE_NEXT).first.click(timeout=SHORT_TIMEOUT_MS)
+            with _SILENCE:
                 # keyboard fallback
                 self._page.keyboard.press("ArrowRight")
 
             # Wait for week label OR fingerprint to change (longer to handle slow loads)
-            for _ in range(30):
-                after_title = (_get_week_title(self._page) or "").strip()
-                after_fp = _period_fingerprint(self._page)
-                after = after_title or after_fp
-                if after and after != before:
-                    return True
-                time.sleep(0.3)
+            if self._wait_period_change(before):
+                return True
         return False
 
     def _go_to_previous_week(self) -> bool:
@@ -1262,148 +1550,90 @@ class NaptaClient:
         - ArrowLeft as keyboard fallback
         - verifies change via title or weekday-header fingerprint
         """
-        before_title = (_get_week_title(self._page) or "").strip()
-        before_fp = _period_fingerprint(self._page)
-        before = before_title or before_fp
+        before = self._period_marker()
 
+        _invalidate_page_cache(self._page)
         attempts = 0
         while attempts < 3:
             attempts += 1
 
             # data-cy: navLeft / PeriodNavigation_navLeft
-            with suppress_exc():
+            with _SILENCE:
                 self._page.locator(
                     '[data-cy*="navLeft"], [data-cy*="PeriodNavigation_navLeft"]'
                 ).first.click(timeout=SHORT_TIMEOUT_MS)
 
             # generic "Previous" / "<"
-            with suppress_exc():
-                self._page.get_by_role(
-                    "button",
-                    name=re.compile(r"Previous|<", re.I)
-                ).first.click(timeout=SHORT_TIMEOUT_MS)
+            with _SILENCE:
+                self._page.get_by_role("button", name=_RE_PREV).first.click(timeout=SHORT_TIMEOUT_MS)
 
             # keyboard fallback
-            with suppress_exc():
+            with _SILENCE:
                 self._page.keyboard.press("ArrowLeft")
 
             # Wait for label/fingerprint to change
-            for _ in range(30):
-                time.sleep(0.3)
-                after_title = (_get_week_title(self._page) or "").strip()
-                after_fp = _period_fingerprint(self._page)
-                after = after_title or after_fp
-                if after and after != before:
-                    return True
+            if self._wait_period_change(before):
+                return True
+
+        return False
 
+    def _period_marker(self) -> Tuple[str, str, str]:
+        """("in-page marker", title, fingerprint) describing the period currently shown."""
+        marker = ""
+        with _SILENCE:
+            marker = self._page.evaluate(_PERIOD_MARKER_JS) or ""
+        if marker:
+            return marker, "", ""
+        title = (_get_week_title(self._page) or "").strip()
+        return marker, title, ("" if title else _period_fingerprint(self._page))
+
+    def _wait_period_change(self, before: Tuple[str, str, str], timeout_ms: int = 9_000) -> bool:
+        """
+        Wait until the period differs from `before`. With an in-page marker the browser
+        watches for the change; otherwise fall back to polling title/fingerprint.
+        Either way, a period that had a label/title only counts as changed once a new
+        non-empty one shows; a blanked title or a header skeleton is not a new week.
+        """
+        marker, before_title, before_fp = before
+        if marker:
+            return bool(_wait_js(self._page, _PERIOD_CHANGED_JS, timeout_ms, arg=marker))
+        end = time.time() + (timeout_ms / 1000.0)
+        delays = _backoff()
+        while time.time() < end:
+            if before_title:
+                after = (_get_week_title(self._page) or "").strip()
+                if after and after != before_title:
+                    return True
+            else:
+                after = _period_fingerprint(self._page)
+                if after and after != before_fp:
+                    return True
+            time.sleep(min(next(delays), max(0.0, end - time.time())))
         return False
 
     # ─────────────────────────── Save / Submit (fast) ───────────────────────────
 
     def _save_current_week_fast(self) -> Tuple[bool, str]:
-        self._ensure_session(headless=True)
-        _, err = _safe_run(lambda: self._open_timesheet(), "page load")
-        if err:
-            if err.startswith("↩️ Cancelled"):
-                self._shutdown()
-            return False, err
-
-
-        # if self._on_login_page():
-        #     name = f"napta_login_required_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-        #     return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
-
-        if self._on_login_page():
-            name = f"napta_login_required_{_now()}.png"
-            self._page.screenshot(path=_shot(name), full_page=True)
-
-            # IMPORTANT: don’t keep a half-initialised Playwright session alive.
-            # In PyInstaller builds this often causes “Task was destroyed…” / “event loop closed” noise.
-            self._shutdown()
-
-            return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
-
-
-        state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
-        if state is None:
-            return True, "ℹ️ Timesheet already submitted for this week."
-
-        if state == "create":
-            if not _click_create(self._page):
-                name = f"napta_create_failure_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-                return False, f"❌ Could not click 'Create timesheet'. Screenshot -> {name}"
-            state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
-            if state is None:
-                return False, "❌ After 'Create', no Save/Submit visible."
-
-        if state == "submit":
-            return True, "✅ Timesheet already saved. 'Submit for approval' is visible."
-
-        if not _click_save(self._page):
-            name = f"napta_save_failure_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-            return False, f"❌ Could not click 'Save'. Screenshot -> {name}"
-
-        _saw_saved_toast(self._page)
-        with suppress_exc(): self._view_cache_path.unlink()
-        return True, "✅ Saved (draft)."
+        return self._do_action(next_week=False, submit=False)
 
     def _save_next_week_fast(self) -> Tuple[bool, str]:
-        self._ensure_session(headless=True)
-        _, err = _safe_run(lambda: self._open_timesheet(), "page load")
-        if err:
-            if err.startswith("↩️ Cancelled"):
-                self._shutdown()
-            return False, err
-
-
-        # if self._on_login_page():
-        #     name = f"napta_login_required_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-        #     return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
+        return self._do_action(next_week=True, submit=False)
 
-        if self._on_login_page():
-            name = f"napta_login_required_{_now()}.png"
-            self._page.screenshot(path=_shot(name), full_page=True)
-
-            # IMPORTANT: don’t keep a half-initialised Playwright session alive.
-            # In PyInstaller builds this often causes “Task was destroyed…” / “event loop closed” noise.
-            self._shutdown()
-
-            return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
-
-
-        if not self._go_to_next_week():
-            name = f"napta_error_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-            return False, f"❌ Could not navigate to next week. Screenshot -> {name}"
-
-        state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
-        if state is None and _has_submit_button(self._page):
-            return True, "✅ Next week saved. Do you want to 'Submit for approval'? Type sbnw"
-        if state is None:
-            chip = (_get_status_chip_text(self._page) or "").strip().lower()
-            if chip.startswith(("approval pending", "submitted")):
-                return True, "ℹ️ Next week already submitted."
-            return True, "✅ Next week already saved. 'Submit for approval' may be visible."
-
-        if state == "create":
-            if not _click_create(self._page):
-                name = f"napta_create_failure_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-                return False, f"❌ Could not click 'Create timesheet'. Screenshot -> {name}"
-            state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
-            if state is None:
-                return False, "❌ After 'Create', no Save/Submit visible."
+    def _submit_current_week_fast(self) -> Tuple[bool, str]:
+        return self._do_action(next_week=False, submit=True)
 
-        if state == "submit":
-            return True, "✅ Next week already saved. 'Submit for approval' is visible."
+    def _submit_next_week_fast(self) -> Tuple[bool, str]:
+        return self._do_action(next_week=True, submit=True)
 
-        if not _click_save(self._page):
-            name = f"napta_save_failure_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-            return False, f"❌ Could not click 'Save'. Screenshot -> {name}"
+    def _do_action(self, *, next_week: bool, submit: bool) -> Tuple[bool, str]:
+        """Save (and optionally submit) the current or next week; messages come from _ACTION_MESSAGES."""
+        def msg(outcome: str) -> str:
+            return _ACTION_MESSAGES[(next_week, submit, outcome)]
 
-        _saw_saved_toast(self._page)
-        with suppress_exc(): self._view_cache_path.unlink()
-        return True, "✅ Next week saved (draft)."
+        def fail(prefix: str, text: str) -> Tuple[bool, str]:
+            name = f"{prefix}_{ts()}.png"; self._page.screenshot(path=_shot(name))
+            return False, f"{text} Screenshot -> {name}"
 
-    def _submit_current_week_fast(self) -> Tuple[bool, str]:
         self._ensure_session(headless=True)
         _, err = _safe_run(lambda: self._open_timesheet(), "page load")
         if err:
@@ -1411,14 +1641,9 @@ class NaptaClient:
                 self._shutdown()
             return False, err
 
-
-        # if self._on_login_page():
-        #     name = f"napta_login_required_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-        #     return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
-
         if self._on_login_page():
             name = f"napta_login_required_{_now()}.png"
-            self._page.screenshot(path=_shot(name), full_page=True)
+            self._page.screenshot(path=_shot(name))
 
             # IMPORTANT: don’t keep a half-initialised Playwright session alive.
             # In PyInstaller builds this often causes “Task was destroyed…” / “event loop closed” noise.
@@ -1426,54 +1651,35 @@ class NaptaClient:
 
             return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
 
+        if next_week and not self._go_to_next_week():
+            return fail("napta_error", "❌ Could not navigate to next week.")
 
         state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
         if state is None:
-            return True, "ℹ️ Timesheet already submitted."
+            if next_week and not submit:
+                probe = _probe(self._page)
+                if _has_submit_button(self._page, probe):
+                    return True, "✅ Next week saved. Do you want to 'Submit for approval'? Type sbnw"
+                if probe["chip"].strip().lower().startswith(("approval pending", "submitted")):
+                    return True, "ℹ️ Next week already submitted."
+                return True, "✅ Next week already saved. 'Submit for approval' may be visible."
+            return True, msg("submitted")
 
         if state == "create":
             if not _click_create(self._page):
-                name = f"napta_create_failure_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-                return False, f"❌ Could not click 'Create timesheet'. Screenshot -> {name}"
+                return fail("napta_create_failure", "❌ Could not click 'Create timesheet'.")
             state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
+            if state is None and not submit:
+                return False, "❌ After 'Create', no Save/Submit visible."
 
-        if state == "save":
+        if not submit:
+            if state == "submit":
+                return True, msg("saved")
             if not _click_save(self._page):
-                return False, "❌ Could not click 'Save' before submit."
+                return fail("napta_save_failure", "❌ Could not click 'Save'.")
             _saw_saved_toast(self._page)
-            state = "submit"
-
-        if state == "submit":
-            if not _click_submit(self._page):
-                return False, "❌ Could not click 'Submit for approval'."
-            if not _wait_until_submitted(self._page, timeout_ms=DEFAULT_TIMEOUT_MS):
-                name = f"napta_submit_verify_{ts()}.png"
-                with suppress_exc(): self._page.screenshot(path=_shot(name), full_page=True)
-                return False, f"❌ Submit click didn't finalize. Screenshot -> {name}"
-            with suppress_exc(): self._view_cache_path.unlink()
-            return True, "✅ Submitted for approval."
-
-        return False, "❌ Unknown state while submitting."
-
-    def _submit_next_week_fast(self) -> Tuple[bool, str]:
-        self._ensure_session(headless=True)
-        _, err = _safe_run(lambda: self._open_timesheet(), "page load")
-        if err:
-            if err.startswith("↩️ Cancelled"):
-                self._shutdown()
-            return False, err
-
-        if self._on_login_page():
-            name = f"napta_login_required_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-            return False, f"⛔ Napta login required. Please open https://app.napta.io once in Chrome. Screenshot -> {name}"
-
-        if not self._go_to_next_week():
-            name = f"napta_error_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-            return False, f"❌ Could not navigate to next week. Screenshot -> {name}"
-
-        state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
-        if state is None:
-            return True, "ℹ️ Next week already submitted."
+            with _SILENCE: self._view_cache_path.unlink()
+            return True, msg("done")
 
         if state == "save":
             if not _click_save(self._page):
@@ -1486,26 +1692,9 @@ class NaptaClient:
                 return False, "❌ Could not click 'Submit for approval'."
             if not _wait_until_submitted(self._page, timeout_ms=DEFAULT_TIMEOUT_MS):
                 name = f"napta_submit_verify_{ts()}.png"
-                with suppress_exc(): self._page.screenshot(path=_shot(name), full_page=True)
+                with _SILENCE: self._page.screenshot(path=_shot(name), full_page=True)
                 return False, f"❌ Submit click didn't finalize. Screenshot -> {name}"
-            with suppress_exc(): self._view_cache_path.unlink()
-            return True, "✅ Next week submitted for approval."
+            with _SILENCE: self._view_cache_path.unlink()
+            return True, msg("done")
 
-        if state == "create":
-            if not _click_create(self._page):
-                name = f"napta_create_failure_{ts()}.png"; self._page.screenshot(path=_shot(name), full_page=True)
-                return False, f"❌ Could not click 'Create timesheet'. Screenshot -> {name}"
-            # After creating, save+submit if available
-            state = _wait_for_save_submit_chip(self._page, timeout_ms=SHORT_TIMEOUT_MS)
-            if state == "save":
-                if not _click_save(self._page):
-                    return False, "❌ Could not click 'Save' after creating."
-                _saw_saved_toast(self._page)
-                state = "submit"
-            if state == "submit":
-                if not _click_submit(self._page):
-                    return False, "❌ Could not click 'Submit for approval'."
-                with suppress_exc(): self._view_cache_path.unlink()
-                return True, "✅ Next week submitted for approval."
-
-        return False, "❌ Unknown state while submitting."
\ No newline at end of file
+        return False, "❌ Unknown state while submitting."
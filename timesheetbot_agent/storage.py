@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
 import tempfile
-import shutil
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +52,11 @@ def get_generated_dir() -> Path:
 # ---------- json io (robust) ----------
 
 def _read_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
     try:
         with path.open("r", encoding="utf-8") as f:
             return json.load(f)
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         logger.warning(f"[storage] failed to read {path}: {e}")
         return {}
@@ -66,14 +65,24 @@ def _read_json(path: Path) -> Dict[str, Any]:
 def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
     """
     Write JSON atomically to avoid corrupting files on crash/kill.
+    Each writer gets its own temp file next to the target (so concurrent CLI runs never
+    share one, and os.replace() never crosses filesystems); it is fsynced before the swap.
     """
-    tmp_dir = Path(tempfile.gettempdir())
-    tmp_path = tmp_dir / (path.name + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    # move into place
     path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(tmp_path), str(path))
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        # move into place
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 # ---------- profile (registration) ----------
@@ -18,7 +18,13 @@ white_fill         = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_
 bold_font  = Font(bold=True)
 red_font   = Font(color="FF0000")
 black_font = Font(color="000000")
+arial_font       = Font(name="Arial", size=12)                               # Body text
+arial_black_font = Font(name="Arial", size=12, bold=False, color="000000")   # Table headers
+arial_red_font   = Font(name="Arial", size=12, bold=False, color="FF0000")   # Remarks
 
 # Alignments
 center_alignment = Alignment(horizontal="center", vertical="center")
 right_alignment  = Alignment(horizontal="right",  vertical="center")
+left_bottom_alignment   = Alignment(horizontal="left",   vertical="bottom")
+center_bottom_alignment = Alignment(horizontal="center", vertical="bottom")
+center_wrap_alignment   = Alignment(horizontal="center", vertical="center", wrap_text=True)